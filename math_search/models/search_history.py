@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchHistory:
     """搜索历史数据类"""
     id: int
@@ -19,15 +19,16 @@ class SearchHistory:
     top_result_url: str
     
     def __post_init__(self):
-        """数据验证"""
-        if not self.query_text:
-            raise ValueError("查询文本不能为空")
-        if self.results_count < 0:
-            raise ValueError("结果数量不能为负数")
-        if not self.search_keywords:
-            raise ValueError("搜索关键词不能为空")
-        if self.id < 0:
-            raise ValueError("ID不能为负数")
+        """数据验证（python -O 运行时整体剥离，信任上游解析器的生产路径零开销）"""
+        if __debug__:
+            if not self.query_text:
+                raise ValueError("查询文本不能为空")
+            if self.results_count < 0:
+                raise ValueError("结果数量不能为负数")
+            if not self.search_keywords:
+                raise ValueError("搜索关键词不能为空")
+            if self.id < 0:
+                raise ValueError("ID不能为负数")
     
     def to_dict(self) -> dict:
         """转换为字典格式"""
@@ -42,9 +43,15 @@ class SearchHistory:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'SearchHistory':
-        """从字典创建实例"""
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        return cls(**data)
+        """从字典创建实例（显式取字段，不修改调用方传入的字典）"""
+        return cls(
+            id=data['id'],
+            query_text=data['query_text'],
+            search_keywords=data['search_keywords'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            results_count=data['results_count'],
+            top_result_url=data['top_result_url']
+        )
     
     def get_summary(self) -> str:
         """获取搜索历史摘要"""
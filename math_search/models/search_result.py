@@ -3,12 +3,13 @@
 Search Result Data Model
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """搜索结果数据类"""
     title: str
@@ -18,14 +19,48 @@ class SearchResult:
     relevance_score: float
     timestamp: datetime
     math_content_detected: bool
-    
+    # 预计算的降序排序键：attrgetter('_neg_score')升序排序即按相关度降序，
+    # 排序热路径免去reverse处理与重复取负
+    _neg_score: float = field(init=False, repr=False, compare=False)
+    # 预计算的URL哈希：去重/集合探测反复哈希同一实例时直接取槽位整数，
+    # 不再逐字符重算长URL的SipHash
+    _url_hash: int = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """数据验证"""
-        if not self.title or not self.url:
-            raise ValueError("标题和URL不能为空")
-        if not 0 <= self.relevance_score <= 1:
-            raise ValueError("相关度评分必须在0-1之间")
-    
+        """数据验证（python -O 运行时整体剥离，信任上游解析器的生产路径零开销）"""
+        if __debug__:
+            if not self.title or not self.url:
+                raise ValueError("标题和URL不能为空")
+            if not 0 <= self.relevance_score <= 1:
+                raise ValueError("相关度评分必须在0-1之间")
+
+        # 驻留来源字符串：来源取值集合很小（arXiv、Wikipedia等），
+        # 大量结果共享同一字符串对象，相等比较退化为指针比较
+        # （冻结实例的初始化规范化需经object.__setattr__）
+        object.__setattr__(self, 'source', sys.intern(self.source))
+        object.__setattr__(self, '_neg_score', -self.relevance_score)
+        object.__setattr__(self, '_url_hash', hash(self.url))
+
+    def __hash__(self) -> int:
+        """仅按URL哈希：结果身份由URL决定，放入set即按URL去重，
+        且免去默认实现对全部七个字段的逐一哈希（构造时已预计算）"""
+        return self._url_hash
+
+    def __setstate__(self, state):
+        """反pickle时重算派生槽位。
+
+        _url_hash来自随机化的字符串哈希，跨进程不可携带：静态缓存
+        构建器pickle的值在服务进程里与hash(url)不一致，会破坏
+        hash/eq约定和按哈希预筛的去重。恢复字段后按当前进程重算，
+        source的驻留同理重做。
+        """
+        # state是dataclasses为frozen+slots生成的字段值列表（含派生字段）
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        object.__setattr__(self, 'source', sys.intern(self.source))
+        object.__setattr__(self, '_neg_score', -self.relevance_score)
+        object.__setattr__(self, '_url_hash', hash(self.url))
+
     def to_dict(self) -> dict:
         """转换为字典格式"""
         return {
@@ -40,6 +75,13 @@ class SearchResult:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'SearchResult':
-        """从字典创建实例"""
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        return cls(**data)
\ No newline at end of file
+        """从字典创建实例（显式取字段，不修改调用方传入的字典）"""
+        return cls(
+            title=data['title'],
+            url=data['url'],
+            snippet=data['snippet'],
+            source=data['source'],
+            relevance_score=data['relevance_score'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            math_content_detected=data['math_content_detected']
+        )
\ No newline at end of file
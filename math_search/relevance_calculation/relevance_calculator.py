@@ -5,8 +5,62 @@ Relevance Calculator Implementation
 
 import re
 import math
+import sys
+from dataclasses import replace
+from functools import lru_cache
 from typing import List, Dict, Set
 from collections import Counter
+from urllib.parse import urlparse
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+# 数学符号与LaTeX标记的统一检测模式：一次扫描同时覆盖两类标记
+_MATH_MARKUP_RE = re.compile(r'(?P<sym>[∫∑∂∇∞≤≥≠±])|(?P<tex>[$\\])')
+
+# 分词模式：连续的字母数字（含下划线与中文）即为一个词，
+# 与"替换标点再按空白切分"等价，但只需一次findall
+_TOKEN_RE = re.compile(r'\w+')
+
+# 高级排序指标的固定键顺序，用于批量构建指标字典
+_METRIC_KEYS = (
+    'base_relevance', 'source_boost', 'math_terms_boost',
+    'domain_depth_boost', 'complexity_boost', 'academic_level_boost',
+    'math_content_detected', 'url', 'title', 'total_boost', 'final_score'
+)
+
+
+def _cosine_kernel(vec1: np.ndarray, vec2: np.ndarray) -> float:
+    """对齐后的稠密向量余弦相似度：点积与范数均在C层完成"""
+    norm1_sq = float(np.dot(vec1, vec1))
+    norm2_sq = float(np.dot(vec2, vec2))
+
+    if norm1_sq == 0.0 or norm2_sq == 0.0:
+        return 0.0
+
+    return float(np.dot(vec1, vec2)) / math.sqrt(norm1_sq * norm2_sq)
+
+
+@lru_cache(maxsize=8)
+def _build_vocab_pattern(terms: frozenset) -> re.Pattern:
+    """
+    为给定词表构建统一扫描正则（等价于多模式自动机的单遍匹配）
+
+    编译结果按词表缓存：多个计算器实例共享同一个已编译模式，
+    重复构造时免去大型交替式的重新编译。
+    """
+    return re.compile(
+        r'(?=\b(' +
+        '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)) +
+        r')\b)'
+    )
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_cached(text: str) -> tuple:
+    """分词结果缓存：同一文本（查询、重复片段）只做一次正则扫描"""
+    return tuple(_TOKEN_RE.findall(text))
 
 from ..interfaces.relevance_calculator import IRelevanceCalculator
 from ..models import SearchResult
@@ -120,7 +174,14 @@ class RelevanceCalculator(IRelevanceCalculator):
             'foundations': 1.6,
             'axiomatics': 1.6
         }
-        
+
+        # 驻留术语键：分词结果与字典键共享同一字符串对象，
+        # 使热路径查找可走指针比较而非逐字符比较
+        self.math_terms_weights = {
+            sys.intern(term): weight
+            for term, weight in self.math_terms_weights.items()
+        }
+
         # 学术来源权重 - 按权威性和专业性分级
         self.academic_sources = {
             # 顶级数学预印本和期刊 (最高权重)
@@ -189,7 +250,143 @@ class RelevanceCalculator(IRelevanceCalculator):
             'siam.org': 1.6,  # Society for Industrial and Applied Mathematics
             'ieee.org': 1.5
         }
-    
+
+        # 学术级别指标权重
+        self.academic_indicators = {
+            # 高级学术指标
+            'phd': 1.4,
+            'doctorate': 1.4,
+            'professor': 1.3,
+            'research': 1.3,
+            'university': 1.2,
+            'college': 1.1,
+
+            # 出版物指标
+            'journal': 1.4,
+            'paper': 1.3,
+            'article': 1.2,
+            'publication': 1.3,
+            'proceedings': 1.3,
+            'conference': 1.2,
+
+            # 教育级别指标
+            'graduate': 1.3,
+            'undergraduate': 1.1,
+            'advanced': 1.2,
+            'introduction': 1.0,
+            'basic': 0.9,
+            'elementary': 0.8,
+
+            # 课程级别指标
+            'course': 1.1,
+            'lecture': 1.2,
+            'seminar': 1.3,
+            'workshop': 1.1,
+            'tutorial': 1.0
+        }
+
+        # 预编译学术指标的正则（按长度降序，单次扫描代替逐词子串查找）
+        self._academic_indicators_re = re.compile(
+            '|'.join(
+                re.escape(indicator)
+                for indicator in sorted(self.academic_indicators, key=len, reverse=True)
+            )
+        )
+
+        # 高级数学概念指标
+        self.advanced_concepts = [
+            'manifold', 'topology', 'homomorphism', 'isomorphism',
+            'eigenvalue', 'eigenvector', 'fourier', 'laplace',
+            'differential equations', 'number theory', 'analysis',
+            'abstract algebra', 'real analysis', 'complex analysis',
+            'functional analysis', 'measure theory', 'category theory'
+        ]
+
+        # 研究级关键词
+        self.research_keywords = [
+            'theorem', 'proof', 'lemma', 'corollary', 'conjecture',
+            'axiom', 'proposition', 'research', 'paper', 'journal',
+            'publication', 'study', 'investigation', 'novel', 'new'
+        ]
+
+        # 高级数学术语列表（用于共现检测）
+        self.advanced_terms = [
+            'manifold', 'homomorphism', 'isomorphism', 'topology',
+            'category theory', 'measure theory', 'functional analysis',
+            'real analysis', 'complex analysis', 'abstract algebra',
+            'algebraic geometry', 'differential geometry', 'operator theory'
+        ]
+        # 冻结集合副本：共现计数用一次C层求交替代逐词成员判断
+        self._advanced_terms_set = frozenset(self.advanced_terms)
+
+        # 数学复杂度指标
+        self.complexity_indicators = {
+            # 高复杂度指标
+            'proof': 2.0,
+            'theorem': 2.0,
+            'lemma': 1.8,
+            'corollary': 1.8,
+            'conjecture': 2.2,
+
+            # 高级数学结构
+            'homomorphism': 2.5,
+            'isomorphism': 2.5,
+            'manifold': 2.3,
+            'topology': 2.1,
+            'category theory': 2.8,
+            'measure theory': 2.4,
+
+            # 数学分析
+            'functional analysis': 2.6,
+            'real analysis': 2.4,
+            'complex analysis': 2.4,
+            'differential equations': 2.2,
+
+            # 代数结构
+            'abstract algebra': 2.3,
+            'group theory': 2.2,
+            'ring theory': 2.2,
+            'field theory': 2.2,
+
+            # 几何
+            'algebraic geometry': 2.7,
+            'differential geometry': 2.5,
+
+            # 基础概念（较低复杂度）
+            'algebra': 1.2,
+            'calculus': 1.3,
+            'geometry': 1.1,
+            'statistics': 1.0,
+            'probability': 1.1
+        }
+
+        # 全量数学词表的统一扫描正则：零宽前瞻允许重叠命中
+        # （如 "real analysis" 同时命中 "analysis"），按长度降序保证
+        # 同一位置优先匹配最长术语，一次线性扫描替代逐词子串查找
+        vocabulary = frozenset(
+            set(self.math_terms_weights)
+            | set(self.advanced_concepts)
+            | set(self.research_keywords)
+            | set(self.advanced_terms)
+            | set(self.complexity_indicators)
+        )
+        self._math_vocab_re = _build_vocab_pattern(vocabulary)
+
+        # 常见词位图：停用词与单词数学术语各占一个比特位（至多128个），
+        # 词汇重叠可用整数位运算+popcount计数代替集合求交/并
+        common_tokens = sorted(
+            self.stop_words | {t for t in self.math_terms_weights if ' ' not in t}
+        )[:128]
+        self._token_bits = {tok: 1 << i for i, tok in enumerate(common_tokens)}
+
+        # 文本权重缓存：同一文本重复评分时直接复用结果
+        self._text_boost_cache: Dict[str, tuple] = {}
+
+        # 来源权重缓存：按URL缓存域名解析与权重查表的结果。
+        # 挂在实例上（而非lru_cache修饰方法）——方法级lru_cache会以
+        # self为键把实例钉在类级缓存里不被回收
+        self._source_boost_cache: Dict[str, float] = {}
+
     def calculate_relevance(self, query: str, result: SearchResult) -> float:
         """
         计算相关度评分
@@ -223,6 +420,54 @@ class RelevanceCalculator(IRelevanceCalculator):
         # 确保评分在0-1范围内
         return min(max(combined_score, 0.0), 1.0)
     
+    def calculate_relevance_batch(self, query: str, results: List[SearchResult]) -> np.ndarray:
+        """
+        批量计算相关度评分
+
+        查询与全部结果文本一次性构建TF-IDF矩阵，余弦相似度经一次
+        稀疏矩阵乘法得到N维向量，避免逐结果重建查询向量；
+        评分公式与calculate_relevance一致（TF-IDF换用统一词表的矩阵实现）。
+
+        Args:
+            query: 查询文本
+            results: 搜索结果列表
+
+        Returns:
+            每个结果的相关度评分数组 (0-1)
+        """
+        n = len(results)
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+
+        texts = [f"{r.title} {r.snippet}" for r in results]
+
+        try:
+            vectorizer = TfidfVectorizer(token_pattern=r'\w+', stop_words=list(self.stop_words))
+            matrix = vectorizer.fit_transform([query] + texts)
+            tfidf_scores = cosine_similarity(matrix[0:1], matrix[1:]).ravel()
+        except ValueError:
+            # 词表为空（如纯停用词查询）时退回逐结果的自定义TF-IDF
+            tfidf_scores = np.fromiter(
+                (self._custom_tfidf_similarity(query, text) for text in texts),
+                dtype=np.float64, count=n
+            )
+
+        keyword_scores = np.fromiter(
+            (self._calculate_keyword_matching(query, r) for r in results),
+            dtype=np.float64, count=n
+        )
+        title_boosts = np.fromiter(
+            (self._calculate_title_boost(query, r.title) for r in results),
+            dtype=np.float64, count=n
+        )
+        math_boosts = np.fromiter(
+            (1.2 if r.math_content_detected else 1.0 for r in results),
+            dtype=np.float64, count=n
+        )
+
+        combined = (tfidf_scores * 0.4 + keyword_scores * 0.4 + 0.2) * math_boosts * title_boosts
+        return np.clip(combined, 0.0, 1.0)
+
     def _calculate_tfidf_similarity(self, query: str, result: SearchResult) -> float:
         """计算TF-IDF相似度"""
         try:
@@ -253,38 +498,39 @@ class RelevanceCalculator(IRelevanceCalculator):
         
         if not all_words:
             return 0.0
-        
-        # 计算TF-IDF向量
-        tfidf1 = {}
-        tfidf2 = {}
-        
-        for word in all_words:
-            # TF计算（归一化词频）
-            tf1_val = tf1.get(word, 0) / len(words1) if len(words1) > 0 else 0
-            tf2_val = tf2.get(word, 0) / len(words2) if len(words2) > 0 else 0
-            
-            # 简化的IDF计算
-            # 如果词在两个文档中都出现，IDF较低；如果只在一个文档中出现，IDF较高
-            df = (1 if tf1.get(word, 0) > 0 else 0) + (1 if tf2.get(word, 0) > 0 else 0)
-            idf = math.log(2 / df) if df > 0 else 0
-            
-            tfidf1[word] = tf1_val * (1 + idf)  # 加1避免0值
-            tfidf2[word] = tf2_val * (1 + idf)
-        
+
+        # 按统一词表对齐为稠密向量，TF/IDF与余弦计算全部走NumPy
+        vocab_size = len(all_words)
+        count1 = np.fromiter((tf1.get(word, 0) for word in all_words),
+                             dtype=np.float64, count=vocab_size)
+        count2 = np.fromiter((tf2.get(word, 0) for word in all_words),
+                             dtype=np.float64, count=vocab_size)
+
+        # TF计算（归一化词频）
+        tf1_vec = count1 / len(words1)
+        tf2_vec = count2 / len(words2)
+
+        # 简化的IDF计算
+        # 如果词在两个文档中都出现，IDF较低；如果只在一个文档中出现，IDF较高
+        df = (count1 > 0).astype(np.float64) + (count2 > 0).astype(np.float64)
+        idf = np.log(2 / df)
+
+        tfidf1 = tf1_vec * (1 + idf)  # 加1避免0值
+        tfidf2 = tf2_vec * (1 + idf)
+
         # 计算余弦相似度
-        return self._cosine_similarity(tfidf1, tfidf2, all_words)
-    
+        return _cosine_kernel(tfidf1, tfidf2)
+
     def _cosine_similarity(self, vec1: Dict[str, float], vec2: Dict[str, float], words: Set[str]) -> float:
-        """计算余弦相似度"""
-        dot_product = sum(vec1.get(word, 0) * vec2.get(word, 0) for word in words)
-        
-        norm1 = math.sqrt(sum(vec1.get(word, 0) ** 2 for word in words))
-        norm2 = math.sqrt(sum(vec2.get(word, 0) ** 2 for word in words))
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
+        """计算余弦相似度（字典向量按词表对齐后交给稠密内核）"""
+        word_list = list(words)
+        vocab_size = len(word_list)
+        arr1 = np.fromiter((vec1.get(word, 0) for word in word_list),
+                           dtype=np.float64, count=vocab_size)
+        arr2 = np.fromiter((vec2.get(word, 0) for word in word_list),
+                           dtype=np.float64, count=vocab_size)
+
+        return _cosine_kernel(arr1, arr2)
     
     def _calculate_keyword_matching(self, query: str, result: SearchResult) -> float:
         """计算关键词匹配评分"""
@@ -302,9 +548,8 @@ class RelevanceCalculator(IRelevanceCalculator):
         # 数学术语匹配加成
         math_term_boost = 1.0
         for term in intersection:
-            if term in self.math_terms_weights:
-                math_term_boost *= self.math_terms_weights[term]
-        
+            math_term_boost *= self.math_terms_weights.get(term, 1.0)
+
         return min(overlap_ratio * math_term_boost, 1.0)
     
     def _calculate_title_boost(self, query: str, title: str) -> float:
@@ -323,25 +568,45 @@ class RelevanceCalculator(IRelevanceCalculator):
         return 1.0 + (title_match_ratio * 0.3)
     
     def _calculate_word_overlap(self, text1: str, text2: str) -> float:
-        """计算简单词汇重叠相似度"""
+        """
+        计算简单词汇重叠相似度
+
+        常见词折叠为整数位图，交/并集大小用popcount统计；
+        词表外的长尾词退回小集合运算，Jaccard结果与纯集合实现一致。
+        """
         words1 = set(self._tokenize_text(text1.lower()))
         words2 = set(self._tokenize_text(text2.lower()))
-        
+
         if not words1 or not words2:
             return 0.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0.0
+
+        token_bits = self._token_bits
+        bits1 = bits2 = 0
+        rare1 = set()
+        rare2 = set()
+
+        for token in words1:
+            bit = token_bits.get(token)
+            if bit is not None:
+                bits1 |= bit
+            else:
+                rare1.add(token)
+
+        for token in words2:
+            bit = token_bits.get(token)
+            if bit is not None:
+                bits2 |= bit
+            else:
+                rare2.add(token)
+
+        intersection = (bits1 & bits2).bit_count() + len(rare1 & rare2)
+        union = (bits1 | bits2).bit_count() + len(rare1 | rare2)
+
+        return intersection / union if union else 0.0
     
     def _tokenize_text(self, text: str) -> List[str]:
-        """文本分词"""
-        # 移除标点符号，保留字母数字
-        text = re.sub(r'[^\w\s]', ' ', text)
-        # 分割并过滤空字符串
-        words = [word.strip() for word in text.split() if word.strip()]
-        return words
+        """文本分词（结果经模块级缓存，重复文本不重跑正则）"""
+        return list(_tokenize_cached(text))
     
     def rank_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """
@@ -354,18 +619,23 @@ class RelevanceCalculator(IRelevanceCalculator):
             按相关度排序的结果列表
         """
         # 多层排序：相关度评分 -> 数学内容检测 -> 学术来源权重 -> 时间戳
-        sorted_results = sorted(
-            results,
-            key=lambda x: (
-                x.relevance_score,  # 主要排序：相关度评分
-                1 if x.math_content_detected else 0,  # 次要排序：数学内容优先
-                self._get_source_boost(x.url),  # 第三排序：学术来源权重
-                x.timestamp  # 最后排序：时间戳（较新的优先）
-            ),
-            reverse=True
-        )
-        
-        return sorted_results
+        # 用NumPy lexsort在C层完成：各键取负号实现降序，lexsort稳定排序
+        # 保证并列结果保持原有相对顺序（与sorted(reverse=True)一致）
+        n = len(results)
+        if n < 2:
+            return list(results)
+
+        scores = np.fromiter((r.relevance_score for r in results), dtype=np.float64, count=n)
+        math_flags = np.fromiter((1.0 if r.math_content_detected else 0.0 for r in results),
+                                 dtype=np.float64, count=n)
+        source_boosts = np.fromiter((self._get_source_boost(r.url) for r in results),
+                                    dtype=np.float64, count=n)
+        timestamps = np.fromiter((r.timestamp.timestamp() for r in results),
+                                 dtype=np.float64, count=n)
+
+        # lexsort以最后一个键为主键：评分 > 数学内容 > 来源权重 > 时间戳
+        order = np.lexsort((-timestamps, -source_boosts, -math_flags, -scores))
+        return [results[i] for i in order]
     
     def apply_math_domain_boost(self, results: List[SearchResult]) -> List[SearchResult]:
         """
@@ -378,184 +648,186 @@ class RelevanceCalculator(IRelevanceCalculator):
             应用权重提升后的结果列表
         """
         boosted_results = []
-        
+        append = boosted_results.append
+
+        # 热循环内把频繁使用的方法绑定到局部变量，省去每轮的属性查找
+        get_source_boost = self._get_source_boost
+        get_text_boosts = self._get_text_boosts
+        get_academic_level_boost = self._get_academic_level_boost
+
         for result in results:
-            # 复制结果对象
-            boosted_result = SearchResult(
-                title=result.title,
-                url=result.url,
-                snippet=result.snippet,
-                source=result.source,
-                relevance_score=result.relevance_score,
-                timestamp=result.timestamp,
-                math_content_detected=result.math_content_detected
-            )
-            
+            # 非数学内容直接保留原始评分，跳过所有文本扫描
+            if not result.math_content_detected:
+                append(replace(result))
+                continue
+
             # 应用学术来源权重
-            source_boost = self._get_source_boost(result.url)
-            
+            source_boost = get_source_boost(result.url)
+
             # 应用数学内容检测权重
-            math_content_boost = 1.15 if result.math_content_detected else 1.0
-            
-            # 应用数学术语权重
-            math_terms_boost = self._get_math_terms_boost(
-                f"{result.title} {result.snippet}"
-            )
-            
-            # 应用数学领域深度权重
-            domain_depth_boost = self._get_math_domain_depth_boost(
-                f"{result.title} {result.snippet}"
-            )
-            
-            # 应用数学复杂度权重
-            complexity_boost = self._calculate_mathematical_complexity_score(
-                f"{result.title} {result.snippet}"
+            math_content_boost = 1.15
+
+            # 整条流水线只做一次小写转换，各权重计算共享同一副本
+            text = f"{result.title} {result.snippet}"
+            text_lower = text.lower()
+
+            # 应用文本相关的权重（术语、领域深度、复杂度，带缓存）
+            math_terms_boost, domain_depth_boost, complexity_boost = (
+                get_text_boosts(text, text_lower)
             )
-            
+
             # 应用学术级别权重
-            academic_level_boost = self._get_academic_level_boost(result)
-            
+            academic_level_boost = get_academic_level_boost(result, text_lower)
+
             # 综合权重提升
             total_boost = (
-                source_boost * 
-                math_content_boost * 
-                math_terms_boost * 
-                domain_depth_boost * 
+                source_boost *
+                math_content_boost *
+                math_terms_boost *
+                domain_depth_boost *
                 complexity_boost *
                 academic_level_boost
             )
-            
-            # 更新相关度评分
-            boosted_result.relevance_score = min(
-                result.relevance_score * total_boost,
-                1.0
-            )
-            
-            boosted_results.append(boosted_result)
-        
+
+            # 复制结果对象并写入提升后的评分（实例已冻结，评分在构造时确定）
+            append(replace(
+                result,
+                relevance_score=min(result.relevance_score * total_boost, 1.0)
+            ))
+
         return boosted_results
     
+    def _get_text_boosts(self, text: str, text_lower: str = None) -> tuple:
+        """
+        计算纯文本相关的三项权重 (术语权重, 领域深度权重, 复杂度权重)
+
+        结果按文本缓存：重复对相同文本评分（如排序稳定性校验、重试场景）
+        时直接复用，无需重跑正则扫描。调用方可传入已小写化的文本副本，
+        避免重复的小写转换分配。
+        """
+        cached = self._text_boost_cache.get(text)
+        if cached is not None:
+            return cached
+
+        # 一次线性扫描得到全部术语命中，各权重计算共享同一结果
+        if text_lower is None:
+            text_lower = text.lower()
+        hits = self._scan_math_terms(text_lower)
+        boosts = (
+            self._get_math_terms_boost(text, hits),
+            self._get_math_domain_depth_boost(text, hits),
+            self._calculate_mathematical_complexity_score(text, hits)
+        )
+
+        # 限制缓存规模，避免长期运行时无界增长
+        if len(self._text_boost_cache) >= 4096:
+            self._text_boost_cache.clear()
+        self._text_boost_cache[text] = boosts
+
+        return boosts
+
+    def _scan_math_terms(self, text_lower: str) -> Counter:
+        """单次扫描统计全量数学词表的命中次数（含词边界匹配）"""
+        return Counter(m.group(1) for m in self._math_vocab_re.finditer(text_lower))
+
     def _get_source_boost(self, url: str) -> float:
-        """获取来源权重加成"""
-        url_lower = url.lower()
-        
-        for domain, weight in self.academic_sources.items():
-            if domain in url_lower:
-                return weight
-        
-        return 1.0  # 默认权重
+        """获取来源权重加成（按URL缓存，重复来源免去域名遍历）"""
+        cached = self._source_boost_cache.get(url)
+        if cached is not None:
+            return cached
+
+        netloc = urlparse(url).netloc.lower()
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+
+        # 精确域名命中：O(1)哈希查找
+        weight = self.academic_sources.get(netloc)
+        if weight is None:
+            # 子域名命中（如 math.mit.edu -> mit.edu）
+            for domain, domain_weight in self.academic_sources.items():
+                if netloc.endswith('.' + domain):
+                    weight = domain_weight
+                    break
+            else:
+                weight = 1.0  # 默认权重
+
+        # 限制缓存规模，避免长期运行时无界增长
+        if len(self._source_boost_cache) >= 1024:
+            self._source_boost_cache.clear()
+        self._source_boost_cache[url] = weight
+        return weight
     
-    def _get_math_terms_boost(self, text: str) -> float:
+    def _get_math_terms_boost(self, text: str, hits: Counter = None) -> float:
         """获取数学术语权重加成 - 增强版"""
-        text_lower = text.lower()
+        if hits is None:
+            hits = self._scan_math_terms(text.lower())
         boost = 1.0
-        
+
         # 计算数学术语出现次数和权重
-        for term, weight in self.math_terms_weights.items():
-            if term in text_lower:
+        for term, count in hits.items():
+            weight = self.math_terms_weights.get(term)
+            if weight is not None:
                 # 每出现一次数学术语，增加一定权重
-                count = text_lower.count(term)
                 boost *= (1.0 + (weight - 1.0) * count * 0.1)
-        
+
         # 数学术语密度加成
-        math_density_boost = self._calculate_math_term_density(text_lower)
+        math_density_boost = self._calculate_math_term_density(text, hits)
         boost *= math_density_boost
-        
+
         # 数学术语共现加成（多个高级术语同时出现）
-        cooccurrence_boost = self._calculate_math_term_cooccurrence(text_lower)
+        cooccurrence_boost = self._calculate_math_term_cooccurrence(text, hits)
         boost *= cooccurrence_boost
-        
+
         # 限制最大权重提升
         return min(boost, 2.5)
     
-    def _get_math_domain_depth_boost(self, text: str) -> float:
+    def _get_math_domain_depth_boost(self, text: str, hits: Counter = None) -> float:
         """获取数学领域深度权重加成"""
-        text_lower = text.lower()
-        
-        # 高级数学概念指标
-        advanced_concepts = [
-            'manifold', 'topology', 'homomorphism', 'isomorphism', 
-            'eigenvalue', 'eigenvector', 'fourier', 'laplace',
-            'differential equations', 'number theory', 'analysis',
-            'abstract algebra', 'real analysis', 'complex analysis',
-            'functional analysis', 'measure theory', 'category theory'
-        ]
-        
-        # 研究级关键词
-        research_keywords = [
-            'theorem', 'proof', 'lemma', 'corollary', 'conjecture',
-            'axiom', 'proposition', 'research', 'paper', 'journal',
-            'publication', 'study', 'investigation', 'novel', 'new'
-        ]
-        
+        if hits is None:
+            hits = self._scan_math_terms(text.lower())
+
         # 计算深度评分
         depth_score = 1.0
-        
+
         # 高级概念加成
-        advanced_count = sum(1 for concept in advanced_concepts if concept in text_lower)
+        advanced_count = sum(1 for concept in self.advanced_concepts if concept in hits)
         if advanced_count > 0:
             depth_score *= (1.0 + advanced_count * 0.15)
-        
+
         # 研究级关键词加成
-        research_count = sum(1 for keyword in research_keywords if keyword in text_lower)
+        research_count = sum(1 for keyword in self.research_keywords if keyword in hits)
         if research_count > 0:
             depth_score *= (1.0 + research_count * 0.1)
         
-        # 数学符号和公式检测（简单启发式）
-        if any(symbol in text for symbol in ['∫', '∑', '∂', '∇', '∞', '≤', '≥', '≠', '±']):
+        # 数学符号和LaTeX标记检测：单次扫描同时判定两类标记
+        has_symbol = has_latex = False
+        for match in _MATH_MARKUP_RE.finditer(text):
+            if match.lastgroup == 'sym':
+                has_symbol = True
+            else:
+                has_latex = True
+            if has_symbol and has_latex:
+                break
+
+        if has_symbol:
             depth_score *= 1.2
-        
-        # LaTeX数学模式检测
-        if '$' in text or '\\' in text:
+        if has_latex:
             depth_score *= 1.15
-        
+
         return min(depth_score, 1.8)
     
-    def _get_academic_level_boost(self, result: SearchResult) -> float:
+    def _get_academic_level_boost(self, result: SearchResult, text_lower: str = None) -> float:
         """获取学术级别权重加成"""
-        text = f"{result.title} {result.snippet}".lower()
-        
-        # 学术级别指标
-        academic_indicators = {
-            # 高级学术指标
-            'phd': 1.4,
-            'doctorate': 1.4,
-            'professor': 1.3,
-            'research': 1.3,
-            'university': 1.2,
-            'college': 1.1,
-            
-            # 出版物指标
-            'journal': 1.4,
-            'paper': 1.3,
-            'article': 1.2,
-            'publication': 1.3,
-            'proceedings': 1.3,
-            'conference': 1.2,
-            
-            # 教育级别指标
-            'graduate': 1.3,
-            'undergraduate': 1.1,
-            'advanced': 1.2,
-            'introduction': 1.0,
-            'basic': 0.9,
-            'elementary': 0.8,
-            
-            # 课程级别指标
-            'course': 1.1,
-            'lecture': 1.2,
-            'seminar': 1.3,
-            'workshop': 1.1,
-            'tutorial': 1.0
-        }
-        
+        if text_lower is None:
+            text_lower = f"{result.title} {result.snippet}".lower()
+
         boost = 1.0
-        
-        # 应用学术级别权重
-        for indicator, weight in academic_indicators.items():
-            if indicator in text:
-                boost *= weight
-        
+
+        # 单次正则扫描找出所有出现的学术指标，每个指标只计权一次
+        matched_indicators = {m.group() for m in self._academic_indicators_re.finditer(text_lower)}
+        for indicator in matched_indicators:
+            boost *= self.academic_indicators[indicator]
+
         # 检查URL中的学术指标
         url_lower = result.url.lower()
         if any(edu_domain in url_lower for edu_domain in ['.edu', '.ac.', 'university', 'college']):
@@ -564,29 +836,21 @@ class RelevanceCalculator(IRelevanceCalculator):
         # 限制权重范围
         return min(max(boost, 0.8), 1.6)
     
-    def _calculate_math_term_density(self, text: str) -> float:
+    def _calculate_math_term_density(self, text: str, hits: Counter = None) -> float:
         """计算数学术语密度加成"""
         words = self._tokenize_text(text)
         if not words:
             return 1.0
-        
-        # 计算数学术语数量（考虑多词术语）
-        math_term_count = 0
-        text_lower = text.lower()
-        
-        for term in self.math_terms_weights.keys():
-            if term in text_lower:
-                # 对于多词术语，只计算一次
-                if ' ' in term:
-                    # 多词术语
-                    math_term_count += text_lower.count(term)
-                else:
-                    # 单词术语，使用词边界匹配
-                    import re
-                    pattern = r'\b' + re.escape(term) + r'\b'
-                    matches = re.findall(pattern, text_lower)
-                    math_term_count += len(matches)
-        
+
+        if hits is None:
+            hits = self._scan_math_terms(text.lower())
+
+        # 计算数学术语数量（命中统计已按词边界匹配，多词术语同样适用）
+        math_term_count = sum(
+            count for term, count in hits.items()
+            if term in self.math_terms_weights
+        )
+
         # 计算密度（数学术语数量 / 总词数）
         density = math_term_count / len(words) if len(words) > 0 else 0
         
@@ -602,79 +866,37 @@ class RelevanceCalculator(IRelevanceCalculator):
         else:
             return 1.0
     
-    def _calculate_math_term_cooccurrence(self, text: str) -> float:
+    def _calculate_math_term_cooccurrence(self, text: str, hits: Counter = None) -> float:
         """计算数学术语共现加成"""
-        # 高级数学术语列表
-        advanced_terms = [
-            'manifold', 'homomorphism', 'isomorphism', 'topology',
-            'category theory', 'measure theory', 'functional analysis',
-            'real analysis', 'complex analysis', 'abstract algebra',
-            'algebraic geometry', 'differential geometry', 'operator theory'
-        ]
-        
-        # 计算高级术语共现数量
-        cooccurring_terms = [term for term in advanced_terms if term in text]
-        
-        if len(cooccurring_terms) >= 3:
+        if hits is None:
+            hits = self._scan_math_terms(text.lower())
+
+        # 计算高级术语共现数量：冻结集合与命中键的一次求交
+        cooccurring_count = len(self._advanced_terms_set.intersection(hits))
+
+        if cooccurring_count >= 3:
             return 1.4  # 3个或更多高级术语同时出现
-        elif len(cooccurring_terms) == 2:
+        elif cooccurring_count == 2:
             return 1.2  # 2个高级术语同时出现
-        elif len(cooccurring_terms) == 1:
+        elif cooccurring_count == 1:
             return 1.1  # 1个高级术语
         else:
             return 1.0  # 无高级术语
     
-    def _calculate_mathematical_complexity_score(self, text: str) -> float:
+    def _calculate_mathematical_complexity_score(self, text: str, hits: Counter = None) -> float:
         """计算数学复杂度评分"""
-        complexity_indicators = {
-            # 高复杂度指标
-            'proof': 2.0,
-            'theorem': 2.0,
-            'lemma': 1.8,
-            'corollary': 1.8,
-            'conjecture': 2.2,
-            
-            # 高级数学结构
-            'homomorphism': 2.5,
-            'isomorphism': 2.5,
-            'manifold': 2.3,
-            'topology': 2.1,
-            'category theory': 2.8,
-            'measure theory': 2.4,
-            
-            # 数学分析
-            'functional analysis': 2.6,
-            'real analysis': 2.4,
-            'complex analysis': 2.4,
-            'differential equations': 2.2,
-            
-            # 代数结构
-            'abstract algebra': 2.3,
-            'group theory': 2.2,
-            'ring theory': 2.2,
-            'field theory': 2.2,
-            
-            # 几何
-            'algebraic geometry': 2.7,
-            'differential geometry': 2.5,
-            
-            # 基础概念（较低复杂度）
-            'algebra': 1.2,
-            'calculus': 1.3,
-            'geometry': 1.1,
-            'statistics': 1.0,
-            'probability': 1.1
-        }
-        
-        text_lower = text.lower()
+        if hits is None:
+            hits = self._scan_math_terms(text.lower())
+
         total_complexity = 0.0
         term_count = 0
-        
-        for term, complexity in complexity_indicators.items():
-            if term in text_lower:
+
+        for term in hits:
+            complexity = self.complexity_indicators.get(term)
+            if complexity is not None:
                 total_complexity += complexity
                 term_count += 1
-        
+
         if term_count == 0:
             return 1.0
         
@@ -694,36 +916,56 @@ class RelevanceCalculator(IRelevanceCalculator):
         Returns:
             每个结果的详细指标列表
         """
-        metrics = []
-        
-        for result in results:
+        if not results:
+            return []
+
+        # 内部采用列式（SoA）布局：先逐列收集各项权重，
+        # 再用NumPy一次性完成乘积和裁剪，最后在接口边界物化为字典列表
+        n = len(results)
+        bases = np.empty(n, dtype=np.float64)
+        source_col = np.empty(n, dtype=np.float64)
+        terms_col = np.empty(n, dtype=np.float64)
+        depth_col = np.empty(n, dtype=np.float64)
+        complexity_col = np.empty(n, dtype=np.float64)
+        academic_col = np.empty(n, dtype=np.float64)
+        math_col = np.empty(n, dtype=np.float64)
+
+        for i, result in enumerate(results):
+            bases[i] = result.relevance_score
+            # 非数学内容无需文本扫描，各项权重保持中性值1.0
+            if not result.math_content_detected:
+                source_col[i] = 1.0
+                terms_col[i] = depth_col[i] = complexity_col[i] = 1.0
+                academic_col[i] = 1.0
+                math_col[i] = 1.0
+                continue
             text = f"{result.title} {result.snippet}"
-            
-            metric = {
-                'base_relevance': result.relevance_score,
-                'source_boost': self._get_source_boost(result.url),
-                'math_terms_boost': self._get_math_terms_boost(text),
-                'domain_depth_boost': self._get_math_domain_depth_boost(text),
-                'complexity_boost': self._calculate_mathematical_complexity_score(text),
-                'academic_level_boost': self._get_academic_level_boost(result),
-                'math_content_detected': result.math_content_detected,
-                'url': result.url,
-                'title': result.title[:50] + '...' if len(result.title) > 50 else result.title
-            }
-            
-            # 计算最终权重
-            total_boost = (
-                metric['source_boost'] * 
-                metric['math_terms_boost'] * 
-                metric['domain_depth_boost'] * 
-                metric['complexity_boost'] *
-                metric['academic_level_boost'] *
-                (1.15 if result.math_content_detected else 1.0)
-            )
-            
-            metric['total_boost'] = total_boost
-            metric['final_score'] = min(result.relevance_score * total_boost, 1.0)
-            
-            metrics.append(metric)
-        
+            text_lower = text.lower()
+            source_col[i] = self._get_source_boost(result.url)
+            terms_col[i], depth_col[i], complexity_col[i] = self._get_text_boosts(text, text_lower)
+            academic_col[i] = self._get_academic_level_boost(result, text_lower)
+            math_col[i] = 1.15
+
+        total_col = (
+            source_col * terms_col * depth_col *
+            complexity_col * academic_col * math_col
+        )
+        final_col = np.minimum(bases * total_col, 1.0)
+
+        metrics = [None] * n
+        for i, result in enumerate(results):
+            metrics[i] = dict(zip(_METRIC_KEYS, (
+                result.relevance_score,
+                float(source_col[i]),
+                float(terms_col[i]),
+                float(depth_col[i]),
+                float(complexity_col[i]),
+                float(academic_col[i]),
+                result.math_content_detected,
+                result.url,
+                result.title[:50] + '...' if len(result.title) > 50 else result.title,
+                float(total_col[i]),
+                float(final_col[i])
+            )))
+
         return metrics
\ No newline at end of file
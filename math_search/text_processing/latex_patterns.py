@@ -0,0 +1,24 @@
+"""
+共享LaTeX公式正则模式
+Shared LaTeX Formula Patterns
+"""
+
+import re
+
+# 统一的LaTeX公式模式：命名分组让一次finditer同时覆盖
+# 块级/行内/环境/命令四类，文本处理器与UI检测共用同一份编译结果，
+# 取代两处各自维护的多趟findall扫描。
+# 分支顺序有语义：块级先于行内（$$...$$不会被行内分支拆开），
+# 环境先于命令（\begin{...}优先按完整环境匹配）。
+# 复杂度边界：不用反向引用、不做嵌套量词，因此不存在指数级的
+# 灾难性回溯。公式分支用否定字符类（[^$]、[^}]）定界，匹配线性；
+# 唯一的例外是env分支的惰性.*?（DOTALL下跨行找\end{...}），
+# 文本中每个无配对的\begin{...}都会让一次失败尝试扫到文末，
+# k个未闭合环境的最坏开销是O(k·n)，而非严格线性。
+LATEX_FORMULA_RE = re.compile(
+    r'(?P<block>\$\$[^$]+\$\$)'
+    r'|(?P<inline>\$[^$]+\$)'
+    r'|(?P<env>\\begin\{[^}]+\}.*?\\end\{[^}]+\})'
+    r'|(?P<cmd>\\[a-zA-Z]+\{[^}]*\})',
+    re.DOTALL
+)
@@ -4,142 +4,280 @@ Text Processor Implementation
 """
 
 import re
+import string
+import sys
 import sympy as sp
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from sympy.parsing.latex import parse_latex
 from sympy.parsing.sympy_parser import parse_expr
+from types import MappingProxyType
 from typing import List, Tuple, Dict, Set, Optional, Union
 from ..interfaces.text_processor import ITextProcessor
 from ..models.math_term import MathTerm
+from .latex_patterns import LATEX_FORMULA_RE
+
+
+# 模式表与术语字典全部提升到模块级：只在import时构建一次，
+# 所有TextProcessor实例共享同一份不可变数据，
+# 频繁创建处理器（如每次测试setup、每次Streamlit重渲染）不再重复建表。
+
+# LaTeX公式模式
+_LATEX_PATTERNS = (
+    r'\$\$[^$]+\$\$',  # 块级公式 $$...$$
+    r'\$[^$]+\$',      # 行内公式 $...$
+    r'\\begin\{[^}]+\}.*?\\end\{[^}]+\}',  # LaTeX环境
+)
+
+# 数学符号和运算符模式
+_MATH_SYMBOL_PATTERNS = (
+    r'[∀∃∈∉⊂⊃⊆⊇∪∩∅]',  # 集合论符号
+    r'[∫∮∑∏∂∇∆]',        # 微积分符号
+    r'[≤≥≠≈≡∞]',          # 比较和特殊符号
+    r'[αβγδεζηθικλμνξοπρστυφχψω]',  # 希腊字母
+    r'[ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ]',  # 大写希腊字母
+    r'[±×÷√∛∜]',          # 基本运算符号
+)
+
+# 数学术语模式（英文）
+_ENGLISH_MATH_TERMS = (
+    # 代数
+    r'\b(?:polynomial|equation|variable|coefficient|constant|expression|function|domain|range|inverse|composition)\b',
+    r'\b(?:linear|quadratic|cubic|exponential|logarithmic|trigonometric)\b',
+    r'\b(?:matrix|determinant|eigenvalue|eigenvector|vector|scalar)\b',
+    r'\b(?:alpha|beta|gamma|delta|epsilon|theta|lambda|mu|pi|sigma|phi|omega)\b',  # 希腊字母英文名
+
+    # 微积分
+    r'\b(?:derivative|integral|limit|continuity|differentiable|antiderivative)\b',
+    r'\b(?:partial|gradient|divergence|curl|laplacian)\b',
+
+    # 几何
+    r'\b(?:triangle|circle|ellipse|parabola|hyperbola|polygon|angle|perpendicular|parallel)\b',
+    r'\b(?:theorem|proof|lemma|corollary|axiom|postulate)\b',
+
+    # 统计
+    r'\b(?:probability|distribution|mean|median|mode|variance|deviation|correlation)\b',
+    r'\b(?:normal|binomial|poisson|chi-square|t-test|hypothesis)\b',
+
+    # 其他
+    r'\b(?:calculus|algebra|geometry|statistics|analysis)\b',
+)
+
+# 数学术语模式（中文）
+_CHINESE_MATH_TERMS = (
+    # 代数
+    r'(?:多项式|方程|变量|系数|常数|表达式|函数|定义域|值域|反函数|复合函数)',
+    r'(?:线性|二次|三次|指数|对数|三角函数)',
+    r'(?:矩阵|行列式|特征值|特征向量|向量|标量)',
+
+    # 微积分
+    r'(?:导数|积分|极限|连续性|可微|原函数)',
+    r'(?:偏导数|梯度|散度|旋度|拉普拉斯)',
+
+    # 几何
+    r'(?:三角形|圆|椭圆|抛物线|双曲线|多边形|角|垂直|平行)',
+    r'(?:定理|证明|引理|推论|公理|公设)',
+
+    # 统计
+    r'(?:概率|分布|均值|中位数|众数|方差|标准差|相关性)',
+    r'(?:正态分布|二项分布|泊松分布|卡方|t检验|假设检验)',
+)
+
+# 数学数字和表达式模式
+_NUMBER_PATTERNS = (
+    r'\b\d+\.\d+\b',      # 小数
+    r'\b\d+/\d+\b',       # 分数
+    r'\b\d+\^\d+\b',      # 指数
+    r'\b\d+!\b',          # 阶乘
+    r'\b\d+%\b',          # 百分比
+)
+
+# 每组模式合并为单一预编译交替正则：识别时每组只扫一趟文本，
+# 取代逐模式finditer的O(模式数×文本长)多趟循环
+_ENGLISH_TERMS_RE = re.compile('|'.join(_ENGLISH_MATH_TERMS), re.IGNORECASE)
+_CHINESE_TERMS_RE = re.compile('|'.join(_CHINESE_MATH_TERMS))
+_SYMBOL_RE = re.compile('|'.join(_MATH_SYMBOL_PATTERNS))
+
+# 数学术语分类字典（frozenset + 只读代理，防止实例间意外串改）。
+# 术语统一sys.intern：同一术语全进程共享一个str对象，
+# frozenset成员测试和去重比较先走指针相等的快路径。
+_RAW_MATH_CATEGORIES = {
+    # 代数相关
+    'algebra': frozenset({
+        'polynomial', 'equation', 'variable', 'coefficient', 'constant', 'expression',
+        'function', 'domain', 'range', 'inverse', 'composition', 'linear', 'quadratic',
+        'cubic', 'matrix', 'determinant', 'eigenvalue', 'eigenvector', 'vector', 'scalar',
+        'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'theta', 'lambda', 'mu',
+        'pi', 'sigma', 'phi', 'omega', 'algebra',
+        '多项式', '方程', '变量', '系数', '常数', '表达式', '函数', '定义域', '值域',
+        '反函数', '复合函数', '线性', '二次', '三次', '矩阵', '行列式', '特征值', '特征向量',
+        '向量', '标量'
+    }),
+
+    # 微积分相关
+    'calculus': frozenset({
+        'derivative', 'integral', 'limit', 'continuity', 'differentiable', 'antiderivative',
+        'partial', 'gradient', 'divergence', 'curl', 'laplacian', 'calculus',
+        '导数', '积分', '极限', '连续性', '可微', '原函数', '偏导数', '梯度', '散度', '旋度',
+        '拉普拉斯'
+    }),
+
+    # 几何相关
+    'geometry': frozenset({
+        'triangle', 'circle', 'ellipse', 'parabola', 'hyperbola', 'polygon', 'angle',
+        'perpendicular', 'parallel', 'theorem', 'proof', 'lemma', 'corollary', 'axiom',
+        'postulate', 'geometry',
+        '三角形', '圆', '椭圆', '抛物线', '双曲线', '多边形', '角', '垂直',
+        '平行', '定理', '证明', '引理', '推论', '公理', '公设'
+    }),
+
+    # 统计相关
+    'statistics': frozenset({
+        'probability', 'distribution', 'mean', 'median', 'mode', 'variance', 'deviation',
+        'correlation', 'normal', 'binomial', 'poisson', 'chi-square', 't-test', 'hypothesis',
+        'statistics',
+        '概率', '分布', '均值', '中位数', '众数', '方差', '标准差', '相关性', '正态分布',
+        '二项分布', '泊松分布', '卡方', 't检验', '假设检验'
+    }),
+
+    # 其他数学分支
+    'analysis': frozenset({
+        'exponential', 'logarithmic', 'trigonometric', 'analysis',
+        '指数', '对数', '三角函数'
+    })
+}
+_MATH_CATEGORIES = MappingProxyType({
+    category: frozenset(map(sys.intern, terms))
+    for category, terms in _RAW_MATH_CATEGORIES.items()
+})
+del _RAW_MATH_CATEGORIES
+
+# 关键词提取用的标点转空格表与停用词表：
+# str.translate是单趟C循环，配合str.split取代逐字符正则扫描
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation + '，。！？；：'})
+_STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'are', 'important', 'concepts', 'along', 'other', 'regular', 'words', 'like'
+})
+
+
+# 批量识别的并行门槛：短文本直接串行处理，
+# 只有超过该长度的文档才值得按段落切块提交线程池
+_PARALLEL_MIN_CHARS = 100_000
+_PARALLEL_WORKERS = 4
+
+
+class _FIFOCache:
+    """极简FIFO缓存，用于命中率高的最热路径。
+
+    相比functools.lru_cache省掉了加锁和命中时的移到队首簿记：
+    命中就是一次dict.get。淘汰依赖dict的插入序，满了删最旧的键。
+    """
+
+    __slots__ = ('_data', '_maxsize')
+
+    def __init__(self, maxsize: int):
+        self._data = {}
+        self._maxsize = maxsize
+
+    def get(self, key):
+        return self._data.get(key)
+
+    def put(self, key, value) -> None:
+        data = self._data
+        if key not in data and len(data) >= self._maxsize:
+            # pop带默认值容忍并发淘汰：identify_many的线程池会并发put，
+            # 两个线程选中同一个最旧键时del会抛KeyError，pop则安全返回
+            # （偶尔多淘汰一条无伤大雅，缓存语义不变）
+            data.pop(next(iter(data)), None)
+        data[key] = value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# 术语识别的结果缓存（原lru_cache，识别足够快后缓存本身成了开销大头）
+_IDENTIFY_CACHE = _FIFOCache(maxsize=4096)
+
+# 关键词生成的组合缓存：同样按文本为键挂在模块级，
+# 避免方法级lru_cache以self为键钉住TextProcessor实例
+_KEYWORDS_CACHE = _FIFOCache(maxsize=2048)
+
+
+# 术语→分类的扁平倒排索引：分类直接存在词条上（叶子存标签），
+# 查分类从逐分类扫描变成一次dict查找，无需再对查询结果做记忆化。
+# 同一术语出现在多个分类时保留字典定义顺序里的第一个。
+_TERM_INDEX = {}
+for _category, _terms in _MATH_CATEGORIES.items():
+    for _term in _terms:
+        _TERM_INDEX.setdefault(_term, _category)
+_TERM_INDEX = MappingProxyType(_TERM_INDEX)
+del _category, _terms, _term
+
+
+def _category_of(term: str) -> str:
+    """查术语的数学分类（未收录返回'other'）"""
+    category = _TERM_INDEX.get(term)
+    if category is not None:
+        return category
+    return _TERM_INDEX.get(term.lower(), 'other')
+
+
+# 公式解析只依赖模块级编译模式，记忆化放在模块函数上：
+# 修饰实例方法的lru_cache会以self为键把TextProcessor钉在缓存里
+@lru_cache(maxsize=4096)
+def _parse_latex_cached(text: str) -> Tuple[str, ...]:
+    """parse_latex_formulas的记忆化内核"""
+    formulas = []
+
+    # 单趟finditer按命名分组分派：块级在模式中先于行内，
+    # 已匹配的$$...$$不会再被行内分支重复拆出
+    for m in LATEX_FORMULA_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == 'block':
+            formulas.append(m.group()[2:-2].strip())
+        elif kind == 'inline':
+            formulas.append(m.group()[1:-1].strip())
+        elif kind == 'env':
+            formulas.append(m.group().strip())
+        # cmd分支供UI侧检测使用，公式解析不收集裸命令
+
+    # 去重并过滤空公式
+    unique_formulas = []
+    seen = set()
+    for formula in formulas:
+        if formula and formula not in seen:
+            seen.add(formula)
+            unique_formulas.append(formula)
+
+    return tuple(unique_formulas)
+
+# 术语到LaTeX表示的映射（原先每次调用临时重建）
+_LATEX_MAPPINGS = MappingProxyType({
+    'alpha': r'\alpha', 'beta': r'\beta', 'gamma': r'\gamma', 'delta': r'\delta',
+    'epsilon': r'\epsilon', 'theta': r'\theta', 'lambda': r'\lambda', 'mu': r'\mu',
+    'pi': r'\pi', 'sigma': r'\sigma', 'phi': r'\phi', 'omega': r'\omega',
+    'integral': r'\int', 'derivative': r'\frac{d}{dx}', 'limit': r'\lim',
+    'infinity': r'\infty', 'sum': r'\sum', 'product': r'\prod',
+    '积分': r'\int', '导数': r'\frac{d}{dx}', '极限': r'\lim',
+    '无穷': r'\infty', '求和': r'\sum', '乘积': r'\prod',
+})
 
 
 class TextProcessor(ITextProcessor):
     """文本处理器实现类"""
-    
+
     def __init__(self):
-        """初始化文本处理器"""
-        self._init_math_patterns()
-        self._init_math_terms_dict()
-    
-    def _init_math_patterns(self):
-        """初始化数学术语识别的正则表达式模式"""
-        
-        # LaTeX公式模式
-        self.latex_patterns = [
-            r'\$\$[^$]+\$\$',  # 块级公式 $$...$$
-            r'\$[^$]+\$',      # 行内公式 $...$
-            r'\\begin\{[^}]+\}.*?\\end\{[^}]+\}',  # LaTeX环境
-        ]
-        
-        # 数学符号和运算符模式
-        self.math_symbol_patterns = [
-            r'[∀∃∈∉⊂⊃⊆⊇∪∩∅]',  # 集合论符号
-            r'[∫∮∑∏∂∇∆]',        # 微积分符号
-            r'[≤≥≠≈≡∞]',          # 比较和特殊符号
-            r'[αβγδεζηθικλμνξοπρστυφχψω]',  # 希腊字母
-            r'[ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ]',  # 大写希腊字母
-            r'[±×÷√∛∜]',          # 基本运算符号
-        ]
-        
-        # 数学术语模式（英文）
-        self.english_math_terms = [
-            # 代数
-            r'\b(?:polynomial|equation|variable|coefficient|constant|expression|function|domain|range|inverse|composition)\b',
-            r'\b(?:linear|quadratic|cubic|exponential|logarithmic|trigonometric)\b',
-            r'\b(?:matrix|determinant|eigenvalue|eigenvector|vector|scalar)\b',
-            r'\b(?:alpha|beta|gamma|delta|epsilon|theta|lambda|mu|pi|sigma|phi|omega)\b',  # 希腊字母英文名
-            
-            # 微积分
-            r'\b(?:derivative|integral|limit|continuity|differentiable|antiderivative)\b',
-            r'\b(?:partial|gradient|divergence|curl|laplacian)\b',
-            
-            # 几何
-            r'\b(?:triangle|circle|ellipse|parabola|hyperbola|polygon|angle|perpendicular|parallel)\b',
-            r'\b(?:theorem|proof|lemma|corollary|axiom|postulate)\b',
-            
-            # 统计
-            r'\b(?:probability|distribution|mean|median|mode|variance|deviation|correlation)\b',
-            r'\b(?:normal|binomial|poisson|chi-square|t-test|hypothesis)\b',
-            
-            # 其他
-            r'\b(?:calculus|algebra|geometry|statistics|analysis)\b',
-        ]
-        
-        # 数学术语模式（中文）
-        self.chinese_math_terms = [
-            # 代数
-            r'(?:多项式|方程|变量|系数|常数|表达式|函数|定义域|值域|反函数|复合函数)',
-            r'(?:线性|二次|三次|指数|对数|三角函数)',
-            r'(?:矩阵|行列式|特征值|特征向量|向量|标量)',
-            
-            # 微积分
-            r'(?:导数|积分|极限|连续性|可微|原函数)',
-            r'(?:偏导数|梯度|散度|旋度|拉普拉斯)',
-            
-            # 几何
-            r'(?:三角形|圆|椭圆|抛物线|双曲线|多边形|角|垂直|平行)',
-            r'(?:定理|证明|引理|推论|公理|公设)',
-            
-            # 统计
-            r'(?:概率|分布|均值|中位数|众数|方差|标准差|相关性)',
-            r'(?:正态分布|二项分布|泊松分布|卡方|t检验|假设检验)',
-        ]
-        
-        # 数学数字和表达式模式
-        self.number_patterns = [
-            r'\b\d+\.\d+\b',      # 小数
-            r'\b\d+/\d+\b',       # 分数
-            r'\b\d+\^\d+\b',      # 指数
-            r'\b\d+!\b',          # 阶乘
-            r'\b\d+%\b',          # 百分比
-        ]
-    
-    def _init_math_terms_dict(self):
-        """初始化数学术语分类字典"""
-        self.math_categories = {
-            # 代数相关
-            'algebra': {
-                'polynomial', 'equation', 'variable', 'coefficient', 'constant', 'expression',
-                'function', 'domain', 'range', 'inverse', 'composition', 'linear', 'quadratic',
-                'cubic', 'matrix', 'determinant', 'eigenvalue', 'eigenvector', 'vector', 'scalar',
-                'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'theta', 'lambda', 'mu',
-                'pi', 'sigma', 'phi', 'omega', 'algebra',
-                '多项式', '方程', '变量', '系数', '常数', '表达式', '函数', '定义域', '值域',
-                '反函数', '复合函数', '线性', '二次', '三次', '矩阵', '行列式', '特征值', '特征向量',
-                '向量', '标量'
-            },
-            
-            # 微积分相关
-            'calculus': {
-                'derivative', 'integral', 'limit', 'continuity', 'differentiable', 'antiderivative',
-                'partial', 'gradient', 'divergence', 'curl', 'laplacian', 'calculus',
-                '导数', '积分', '极限', '连续性', '可微', '原函数', '偏导数', '梯度', '散度', '旋度',
-                '拉普拉斯'
-            },
-            
-            # 几何相关
-            'geometry': {
-                'triangle', 'circle', 'ellipse', 'parabola', 'hyperbola', 'polygon', 'angle',
-                'perpendicular', 'parallel', 'theorem', 'proof', 'lemma', 'corollary', 'axiom',
-                'postulate', 'geometry',
-                '三角形', '圆', '椭圆', '抛物线', '双曲线', '多边形', '角', '垂直',
-                '平行', '定理', '证明', '引理', '推论', '公理', '公设'
-            },
-            
-            # 统计相关
-            'statistics': {
-                'probability', 'distribution', 'mean', 'median', 'mode', 'variance', 'deviation',
-                'correlation', 'normal', 'binomial', 'poisson', 'chi-square', 't-test', 'hypothesis',
-                'statistics',
-                '概率', '分布', '均值', '中位数', '众数', '方差', '标准差', '相关性', '正态分布',
-                '二项分布', '泊松分布', '卡方', 't检验', '假设检验'
-            },
-            
-            # 其他数学分支
-            'analysis': {
-                'exponential', 'logarithmic', 'trigonometric', 'analysis',
-                '指数', '对数', '三角函数'
-            }
-        }
+        """初始化文本处理器（实例属性只是模块级共享数据的引用）"""
+        self.latex_patterns = _LATEX_PATTERNS
+        self.math_symbol_patterns = _MATH_SYMBOL_PATTERNS
+        self.english_math_terms = _ENGLISH_MATH_TERMS
+        self.chinese_math_terms = _CHINESE_MATH_TERMS
+        self.number_patterns = _NUMBER_PATTERNS
+        self.math_categories = _MATH_CATEGORIES
+        self._english_terms_re = _ENGLISH_TERMS_RE
+        self._chinese_terms_re = _CHINESE_TERMS_RE
+        self._symbol_re = _SYMBOL_RE
     
     def extract_selected_text(self, content: str, selection_range: Tuple[int, int]) -> str:
         """
@@ -169,115 +307,165 @@ class TextProcessor(ITextProcessor):
     def identify_math_terms(self, text: str) -> List[MathTerm]:
         """
         识别数学术语
-        
+
         Args:
             text: 输入文本
-            
+
         Returns:
             识别出的数学术语列表
         """
+        # 识别是纯函数且MathTerm不可变，按文本记忆化：
+        # 编辑器重渲染/重复段落的再次识别退化为一次字典查找
+        return list(self._identify_cached(text))
+
+    def identify_many(self, texts: Union[str, List[str]]) -> List[List[MathTerm]]:
+        """
+        批量识别数学术语
+
+        Args:
+            texts: 单个文本或文本列表
+
+        Returns:
+            与输入一一对应的术语列表的列表
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        # 短文本直接走记忆化的单文本路径；
+        # 超长文档按段落切块并行扫描后合并去重
+        return [
+            self._identify_long(text) if len(text) >= _PARALLEL_MIN_CHARS
+            else self.identify_math_terms(text)
+            for text in texts
+        ]
+
+    def _identify_long(self, text: str) -> List[MathTerm]:
+        """长文档识别：按空行分段提交线程池，各段结果合并去重"""
+        paragraphs = [p for p in text.split('\n\n') if p.strip()]
+        if len(paragraphs) <= 1:
+            return self.identify_math_terms(text)
+
+        with ThreadPoolExecutor(max_workers=_PARALLEL_WORKERS) as pool:
+            chunks = list(pool.map(self._identify_cached, paragraphs))
+
+        merged = [term for chunk in chunks for term in chunk]
+        unique_terms = self._deduplicate_terms(merged)
+        return sorted(unique_terms, key=lambda x: x.confidence, reverse=True)
+
+    def _identify_cached(self, text: str) -> Tuple[MathTerm, ...]:
+        """identify_math_terms的记忆化内核，返回不可变元组供缓存共享"""
+        cached = _IDENTIFY_CACHE.get(text)
+        if cached is not None:
+            return cached
+
         math_terms = []
-        text_lower = text.lower()
-        
-        # 识别英文数学术语
-        for pattern in self.english_math_terms:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                term = match.group().lower()
-                category = self._get_term_category(term)
-                confidence = self._calculate_confidence(term, text)
-                latex_repr = self._get_latex_representation(term)
-                
-                math_terms.append(MathTerm(
-                    term=term,
-                    latex_representation=latex_repr,
-                    category=category,
-                    confidence=confidence
-                ))
-        
-        # 识别中文数学术语
-        for pattern in self.chinese_math_terms:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                term = match.group()
-                category = self._get_term_category(term)
-                confidence = self._calculate_confidence(term, text)
-                latex_repr = self._get_latex_representation(term)
-                
-                math_terms.append(MathTerm(
+
+        # 热循环里的属性/方法查找全部提升为局部名：
+        # LOAD_FAST比逐次LOAD_ATTR省一层字典查找，长文本下可观
+        intern = sys.intern
+        get_category = self._get_term_category
+        get_confidence = self._calculate_confidence
+        get_latex = self._get_latex_representation
+        append = math_terms.append
+
+        # 去重提前到构造之前：长文档里同一术语重复出现成百上千次，
+        # 按(term, category)键先查重，重复命中连MathTerm对象都不分配，
+        # 置信度/LaTeX表示也只为首次出现计算一次
+        seen = set()
+
+        # 识别英文数学术语（单一交替模式，一趟扫描）。
+        # 匹配结果intern后与字典里的术语共享同一str对象，
+        # 后续分类/去重的成员测试直接命中指针相等
+        for match in self._english_terms_re.finditer(text):
+            term = intern(match.group().lower())
+            category = get_category(term)
+            if (term, category) in seen:
+                continue
+            seen.add((term, category))
+            append(MathTerm(
+                term=term,
+                latex_representation=get_latex(term),
+                category=category,
+                confidence=get_confidence(term, text)
+            ))
+
+        # ASCII快速路径：中文术语和数学符号模式只含非ASCII字符，
+        # 纯ASCII文本（英文笔记的常见情形）上不可能命中，
+        # isascii()是O(1)的C层标志检查，直接跳过这两趟扫描
+        if not text.isascii():
+            # 识别中文数学术语
+            for match in self._chinese_terms_re.finditer(text):
+                term = intern(match.group())
+                category = get_category(term)
+                if (term, category) in seen:
+                    continue
+                seen.add((term, category))
+                append(MathTerm(
                     term=term,
-                    latex_representation=latex_repr,
+                    latex_representation=get_latex(term),
                     category=category,
-                    confidence=confidence
+                    confidence=get_confidence(term, text)
                 ))
-        
-        # 识别数学符号
-        for pattern in self.math_symbol_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+
+            # 识别数学符号
+            for match in self._symbol_re.finditer(text):
                 symbol = match.group()
-                math_terms.append(MathTerm(
+                key = (symbol.lower(), 'other')  # 大小写希腊字母视作同一符号
+                if key in seen:
+                    continue
+                seen.add(key)
+                append(MathTerm(
                     term=symbol,
                     latex_representation=symbol,
                     category='other',
                     confidence=0.9
                 ))
-        
-        # 去重并按置信度排序
-        unique_terms = self._deduplicate_terms(math_terms)
-        return sorted(unique_terms, key=lambda x: x.confidence, reverse=True)
-    
+
+        # 按置信度排序（去重已在扫描时完成）
+        math_terms.sort(key=lambda x: x.confidence, reverse=True)
+        result = tuple(math_terms)
+        _IDENTIFY_CACHE.put(text, result)
+        return result
+
     def parse_latex_formulas(self, text: str) -> List[str]:
         """
         解析LaTeX公式
-        
+
         Args:
             text: 包含LaTeX公式的文本
-            
+
         Returns:
             解析出的LaTeX公式列表
         """
-        formulas = []
-        
-        # 按优先级顺序处理，避免重复匹配
-        # 先处理块级公式
-        block_matches = re.findall(r'\$\$([^$]+)\$\$', text, re.DOTALL)
-        for match in block_matches:
-            formulas.append(match.strip())
-        
-        # 移除已匹配的块级公式，避免重复
-        text_without_blocks = re.sub(r'\$\$[^$]+\$\$', '', text, flags=re.DOTALL)
-        
-        # 处理行内公式
-        inline_matches = re.findall(r'\$([^$]+)\$', text_without_blocks)
-        for match in inline_matches:
-            formulas.append(match.strip())
-        
-        # 处理LaTeX环境
-        env_matches = re.findall(r'(\\begin\{[^}]+\}.*?\\end\{[^}]+\})', text, re.DOTALL)
-        for match in env_matches:
-            formulas.append(match.strip())
-        
-        # 去重并过滤空公式
-        unique_formulas = []
-        seen = set()
-        for formula in formulas:
-            if formula and formula not in seen:
-                seen.add(formula)
-                unique_formulas.append(formula)
-        
-        return unique_formulas
+        return list(_parse_latex_cached(text))
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """清空记忆化缓存（长期运行的进程可定期调用释放内存）"""
+        _IDENTIFY_CACHE.clear()
+        _KEYWORDS_CACHE.clear()
+        _parse_latex_cached.cache_clear()
     
     def generate_search_keywords(self, text: str) -> List[str]:
         """
         生成搜索关键词
-        
+
         Args:
             text: 输入文本
-            
+
         Returns:
             生成的搜索关键词列表
         """
+        # 组合缓存：两条底层流水线（识别、公式解析）已各自记忆化，
+        # 排序截断同样确定，整体结果也按文本缓存，重复调用退化为一次查找
+        return list(self._keywords_cached(text))
+
+    def _keywords_cached(self, text: str) -> Tuple[str, ...]:
+        """generate_search_keywords的记忆化内核（上限固定为10个关键词）"""
+        cached = _KEYWORDS_CACHE.get(text)
+        if cached is not None:
+            return cached
+
         keywords = set()
         
         # 添加识别出的数学术语
@@ -290,21 +478,30 @@ class TextProcessor(ITextProcessor):
         formulas = self.parse_latex_formulas(text)
         keywords.update(formulas)
         
-        # 添加重要的普通词汇（去除停用词）
-        words = re.findall(r'\b[a-zA-Z\u4e00-\u9fff]{3,}\b', text)
-        stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'are', 'important', 'concepts', 'along', 'other', 'regular', 'words', 'like'}
-        for word in words:
-            if word.lower() not in stop_words and len(word) >= 3:
+        # 添加重要的普通词汇（去除停用词）：
+        # 标点translate成空格后按空白切分，纯C路径取代正则findall
+        for word in text.translate(_PUNCT_TABLE).split():
+            if len(word) >= 3 and word.isalpha() and word.lower() not in _STOP_WORDS:
                 keywords.add(word)
         
-        # 限制关键词数量，优先选择数学相关的
-        keywords_list = list(keywords)
-        math_keywords = [kw for kw in keywords_list if self._is_math_related(kw)]
-        other_keywords = [kw for kw in keywords_list if not self._is_math_related(kw)]
-        
+        # 限制关键词数量，优先选择数学相关的。
+        # 优先级只有数学/非数学两级，无需排序或堆：单趟分桶，
+        # 每个候选只判一次_is_math_related，两桶都满即提前结束
+        math_keywords = []
+        other_keywords = []
+        for kw in keywords:
+            if self._is_math_related(kw):
+                if len(math_keywords) < 8:
+                    math_keywords.append(kw)
+            elif len(other_keywords) < 4:
+                other_keywords.append(kw)
+            if len(math_keywords) == 8 and len(other_keywords) == 4:
+                break
+
         # 优先返回数学关键词，然后是其他关键词
-        result = math_keywords[:8] + other_keywords[:4]
-        return result[:10]  # 最多返回10个关键词
+        result = tuple((math_keywords + other_keywords)[:10])  # 最多返回10个关键词
+        _KEYWORDS_CACHE.put(text, result)
+        return result
     
     def parse_latex_to_sympy(self, latex_formula: str) -> Optional[sp.Basic]:
         """
@@ -530,9 +727,7 @@ class TextProcessor(ITextProcessor):
         concepts['terms'] = [term.term for term in math_terms]
         
         # 提取数学符号
-        for pattern in self.math_symbol_patterns:
-            matches = re.findall(pattern, text)
-            concepts['symbols'].extend(matches)
+        concepts['symbols'].extend(self._symbol_re.findall(text))
         
         # 去重
         for key in concepts:
@@ -608,13 +803,7 @@ class TextProcessor(ITextProcessor):
     
     def _get_term_category(self, term: str) -> str:
         """获取术语的数学分类"""
-        term_lower = term.lower()
-        
-        for category, terms in self.math_categories.items():
-            if term_lower in terms or term in terms:
-                return category
-        
-        return 'other'
+        return _category_of(term)
     
     def _calculate_confidence(self, term: str, context: str) -> float:
         """计算术语识别的置信度"""
@@ -636,17 +825,7 @@ class TextProcessor(ITextProcessor):
     
     def _get_latex_representation(self, term: str) -> str:
         """获取术语的LaTeX表示"""
-        latex_mappings = {
-            'alpha': r'\alpha', 'beta': r'\beta', 'gamma': r'\gamma', 'delta': r'\delta',
-            'epsilon': r'\epsilon', 'theta': r'\theta', 'lambda': r'\lambda', 'mu': r'\mu',
-            'pi': r'\pi', 'sigma': r'\sigma', 'phi': r'\phi', 'omega': r'\omega',
-            'integral': r'\int', 'derivative': r'\frac{d}{dx}', 'limit': r'\lim',
-            'infinity': r'\infty', 'sum': r'\sum', 'product': r'\prod',
-            '积分': r'\int', '导数': r'\frac{d}{dx}', '极限': r'\lim',
-            '无穷': r'\infty', '求和': r'\sum', '乘积': r'\prod',
-        }
-        
-        return latex_mappings.get(term.lower(), term)
+        return _LATEX_MAPPINGS.get(term.lower(), term)
     
     def _deduplicate_terms(self, terms: List[MathTerm]) -> List[MathTerm]:
         """去除重复的数学术语"""
@@ -663,29 +842,19 @@ class TextProcessor(ITextProcessor):
     
     def _is_math_related(self, word: str) -> bool:
         """判断词汇是否与数学相关"""
-        word_lower = word.lower()
-        
         # 检查是否在数学术语字典中
-        for terms in self.math_categories.values():
-            if word_lower in terms or word in terms:
-                return True
-        
+        if _category_of(word) != 'other':
+            return True
+
         # 检查是否包含数学符号
-        for pattern in self.math_symbol_patterns:
-            if re.search(pattern, word):
-                return True
-        
+        if self._symbol_re.search(word):
+            return True
+
         return False
-    
+
     def _is_known_math_term(self, term: str) -> bool:
         """检查是否为已知的数学术语"""
-        term_lower = term.lower()
-        
-        for terms in self.math_categories.values():
-            if term_lower in terms or term in terms:
-                return True
-        
-        return False
+        return _category_of(term) != 'other'
     
     def _has_math_context(self, term: str, context: str) -> bool:
         """检查术语周围是否有数学上下文"""
@@ -700,9 +869,8 @@ class TextProcessor(ITextProcessor):
         surrounding_text = context[start:end]
         
         # 检查是否包含数学符号或公式
-        for pattern in self.math_symbol_patterns:
-            if re.search(pattern, surrounding_text):
-                return True
+        if self._symbol_re.search(surrounding_text):
+            return True
         
         # 检查是否包含数学相关词汇
         math_context_words = ['equation', 'formula', 'calculate', 'solve', 'proof', '公式', '计算', '求解', '证明']
@@ -1,11 +1,30 @@
 """
 用户界面管理器 - 管理Streamlit界面组件和交互
 """
+import heapq
+import numpy as np
 import streamlit as st
-from typing import Optional, Tuple, List
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Optional, Tuple, List
 import re
 from ..models.search_result import SearchResult
 from ..models.search_history import SearchHistory
+from ..text_processing.latex_patterns import LATEX_FORMULA_RE
+
+# C实现的排序键提取器：_neg_score升序即相关度降序（构造时预先取负）
+_NEG_SCORE = attrgetter('_neg_score')
+_TIMESTAMP = attrgetter('timestamp')
+_SOURCE = attrgetter('source')
+
+
+# 检测是纯函数，按文本记忆化在模块级（UIManager每次重渲染都会新建实例，
+# 实例级缓存活不过一次rerun）；返回元组保证缓存条目不可变
+@lru_cache(maxsize=1024)
+def _detect_math_cached(text: str) -> Tuple[str, ...]:
+    """_detect_math_content的记忆化内核"""
+    return tuple({m.group() for m in LATEX_FORMULA_RE.finditer(text)})
 
 
 class UIManager:
@@ -149,18 +168,17 @@ class UIManager:
         
         # 搜索结果标题和统计信息
         st.subheader(f"🎯 搜索结果")
-        
-        # 结果统计信息
-        math_count = sum(1 for r in results if r.math_content_detected)
+
+        # 结果统计信息（每次Streamlit重跑都会执行，统计在C层单趟完成）
+        stats = self._summarize_results(results)
         stats_col1, stats_col2, stats_col3 = st.columns(3)
-        
+
         with stats_col1:
-            st.metric("总结果", len(results))
+            st.metric("总结果", stats['total'])
         with stats_col2:
-            st.metric("数学内容", math_count)
+            st.metric("数学内容", stats['math_count'])
         with stats_col3:
-            avg_relevance = sum(r.relevance_score for r in results) / len(results)
-            st.metric("平均相关度", f"{avg_relevance:.2f}")
+            st.metric("平均相关度", f"{stats['avg_relevance']:.2f}")
         
         # 搜索结果控制面板
         with st.expander("🔧 结果筛选和排序", expanded=False):
@@ -193,31 +211,37 @@ class UIManager:
                 
                 source_filter = st.multiselect(
                     "来源筛选",
-                    options=list(set(r.source for r in results)),
-                    default=list(set(r.source for r in results)),
+                    options=list(stats['by_source']),
+                    default=list(stats['by_source']),
                     key="source_filter",
                     help="选择要显示的结果来源"
                 )
         
-        # 过滤和排序结果
-        filtered_results = results
-        
-        # 应用筛选条件
+        # 过滤：列式数组+布尔掩码，三个筛选条件在C层一次合成，
+        # 替代逐结果的多趟列表推导（用户每拨动一次控件都会重跑）
+        n = len(results)
+        scores = np.fromiter(
+            (r.relevance_score for r in results), dtype=np.float64, count=n
+        )
+        mask = scores >= min_relevance
+
         if show_math_only:
-            filtered_results = [r for r in filtered_results if r.math_content_detected]
-        
-        filtered_results = [r for r in filtered_results if r.relevance_score >= min_relevance]
-        
+            math_flags = np.fromiter(
+                (r.math_content_detected for r in results), dtype=np.bool_, count=n
+            )
+            mask &= math_flags
+
         if source_filter:
-            filtered_results = [r for r in filtered_results if r.source in source_filter]
+            sources = np.array([r.source for r in results], dtype=object)
+            mask &= np.isin(sources, source_filter)
+
+        filtered_results = [results[i] for i in np.flatnonzero(mask).tolist()]
         
-        # 应用排序
-        if sort_by == "相关度":
-            filtered_results.sort(key=lambda x: x.relevance_score, reverse=True)
-        elif sort_by == "时间":
-            filtered_results.sort(key=lambda x: x.timestamp, reverse=True)
+        # 应用排序（相关度排序延后到分页阶段：只看第一页时无需全量排序）
+        if sort_by == "时间":
+            filtered_results.sort(key=_TIMESTAMP, reverse=True)
         elif sort_by == "来源":
-            filtered_results.sort(key=lambda x: x.source)
+            filtered_results.sort(key=_SOURCE)
         
         # 显示过滤后的结果数量
         if len(filtered_results) != len(results):
@@ -246,14 +270,71 @@ class UIManager:
         
         # 计算当前页面的结果范围
         start_idx = (current_page - 1) * results_per_page
-        end_idx = min(start_idx + results_per_page, len(filtered_results))
-        page_results = filtered_results[start_idx:end_idx]
-        
+        if sort_by == "相关度":
+            page_results = self._get_page_results(
+                filtered_results, current_page, results_per_page
+            )
+        else:
+            end_idx = min(start_idx + results_per_page, len(filtered_results))
+            page_results = filtered_results[start_idx:end_idx]
+
         # 显示结果卡片
         for i, result in enumerate(page_results):
             result_idx = start_idx + i
             self._render_result_card(result, result_idx)
     
+    def _get_page_results(self, results: List[SearchResult],
+                          page: int, per_page: int) -> List[SearchResult]:
+        """
+        按相关度降序取第page页的结果
+
+        浏览前几页时用heapq.nlargest只选Top-K（O(N log K)），
+        免去对整个结果列表的完整排序；深翻页退回普通排序。
+
+        Args:
+            results: 过滤后的结果列表
+            page: 页码（从1开始）
+            per_page: 每页结果数
+
+        Returns:
+            当前页的结果列表
+        """
+        end = page * per_page
+        if end < len(results) // 4:
+            top = heapq.nsmallest(end, results, key=_NEG_SCORE)
+            return top[(page - 1) * per_page:end]
+
+        ordered = sorted(results, key=_NEG_SCORE)
+        return ordered[(page - 1) * per_page:end]
+
+    def _summarize_results(self, results: List[SearchResult]) -> Dict:
+        """
+        汇总搜索结果统计信息
+
+        计数与均值通过NumPy数组归约在C层完成，来源分布用Counter统计，
+        避免渲染路径上的多趟Python生成器扫描。
+
+        Args:
+            results: 搜索结果列表
+
+        Returns:
+            Dict: 含总数、数学内容数、平均相关度、来源分布的统计字典
+        """
+        n = len(results)
+        scores = np.fromiter(
+            (r.relevance_score for r in results), dtype=np.float32, count=n
+        )
+        flags = np.fromiter(
+            (r.math_content_detected for r in results), dtype=np.bool_, count=n
+        )
+        return {
+            'total': n,
+            # count_nonzero走SIMD化的字节计数，比布尔sum的归约更快
+            'math_count': int(np.count_nonzero(flags)),
+            'avg_relevance': float(scores.mean()) if n else 0.0,
+            'by_source': Counter(r.source for r in results)
+        }
+
     def _render_result_card(self, result: SearchResult, index: int) -> None:
         """
         渲染单个搜索结果卡片
@@ -443,20 +524,9 @@ class UIManager:
         Returns:
             List[str]: 检测到的数学公式列表
         """
-        # LaTeX公式模式
-        latex_patterns = [
-            r'\$\$.*?\$\$',  # 块级公式
-            r'\$.*?\$',      # 行内公式
-            r'\\begin\{.*?\}.*?\\end\{.*?\}',  # 环境
-            r'\\[a-zA-Z]+\{.*?\}',  # LaTeX命令
-        ]
-        
-        math_content = []
-        for pattern in latex_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            math_content.extend(matches)
-        
-        return list(set(math_content))  # 去重
+        # 与文本处理器共用同一份编译模式：单趟finditer覆盖
+        # 块级/行内/环境/命令四类；同一缓冲区的重复检测命中模块级缓存
+        return list(_detect_math_cached(text))
     
     def get_search_state(self) -> dict:
         """
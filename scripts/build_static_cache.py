@@ -0,0 +1,64 @@
+"""
+静态查询缓存构建脚本
+Static Query Cache Build Script
+
+读取查询日志（每行一条查询，关键词以空白分隔），统计出现频率最高的
+关键词组合，对每组真实调用一次搜索API，并把结果序列化到
+math_search/data/static_query_cache.pkl。SearchManager启动时加载该文件，
+高频查询无需任何网络请求即可命中。
+
+用法:
+    python scripts/build_static_cache.py query_log.txt --top-k 50
+"""
+
+import argparse
+import pickle
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from math_search.config.settings import Settings
+from math_search.search_management.search_manager import SearchManager, _STATIC_CACHE_PATH
+
+
+def collect_top_queries(log_path: Path, top_k: int) -> list:
+    """统计日志中频率最高的top_k个关键词组合（排序小写后去重计数）"""
+    counter = Counter()
+    with open(log_path, encoding='utf-8') as f:
+        for line in f:
+            keywords = line.split()
+            if keywords:
+                counter[tuple(sorted(kw.lower() for kw in keywords))] += 1
+    return [key for key, _ in counter.most_common(top_k)]
+
+
+def build_cache(log_path: Path, top_k: int) -> None:
+    """对高频查询逐条执行真实搜索并写出pickle缓存文件"""
+    manager = SearchManager(Settings.from_env())
+    cache = {}
+
+    for key in collect_top_queries(log_path, top_k):
+        results = manager.search_web(list(key))
+        if results:
+            cache[key] = results
+            print(f"已缓存: {' '.join(key)} ({len(results)} 条结果)")
+
+    _STATIC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(_STATIC_CACHE_PATH, 'wb') as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"静态缓存已写入 {_STATIC_CACHE_PATH}: {len(cache)} 条查询")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='构建热门查询静态缓存')
+    parser.add_argument('query_log', type=Path, help='查询日志文件路径')
+    parser.add_argument('--top-k', type=int, default=50,
+                        help='缓存的高频查询数量（默认50）')
+    args = parser.parse_args()
+    build_cache(args.query_log, args.top_k)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""
+pytest共享fixture
+Shared Pytest Fixtures
+"""
+
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture(scope='module')
+def make_mock_response():
+    """模拟HTTP响应工厂：统一json/text/raise_for_status配置，
+    免去各测试重复搭建相同的Mock对象"""
+    def _make(json_data=None, text=None):
+        response = Mock()
+        response.json.return_value = json_data
+        response.text = text or ''
+        response.raise_for_status.return_value = None
+        return response
+    return _make
@@ -3,7 +3,14 @@
 Relevance Calculation and Sorting Demo
 """
 
+import sys
+import os
+from dataclasses import replace
 from datetime import datetime
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from math_search.relevance_calculation import RelevanceCalculator
 from math_search.models import SearchResult
 
@@ -77,16 +84,17 @@ def demo_relevance_calculation():
     print(f"Query: {query}")
     print("-" * 40)
     
-    # 计算相关度
+    # 计算相关度（SearchResult不可变，通过replace生成带评分的新实例）
     print("\n1. 计算基础相关度评分...")
+    scored_results = []
     for result in results:
         score = calculator.calculate_relevance(query, result)
-        result.relevance_score = score
+        scored_results.append(replace(result, relevance_score=score))
         print(f"   {result.title[:40]:<40} | 评分: {score:.3f}")
-    
+
     # 应用数学领域权重提升
     print("\n2. 应用数学领域权重提升...")
-    boosted_results = calculator.apply_math_domain_boost(results)
+    boosted_results = calculator.apply_math_domain_boost(scored_results)
     
     for result in boosted_results:
         print(f"   {result.title[:40]:<40} | 提升后: {result.relevance_score:.3f}")
@@ -112,7 +120,7 @@ def demo_relevance_calculation():
     print("Detailed Sorting Metrics Analysis:")
     print("-" * 80)
     
-    metrics = calculator.get_advanced_sorting_metrics(results)
+    metrics = calculator.get_advanced_sorting_metrics(scored_results)
     
     for i, metric in enumerate(metrics, 1):
         print(f"{i}. {metric['title']}")
@@ -148,12 +156,13 @@ def demo_different_queries():
         print(f"\n查询: '{query}'")
         print("-" * 30)
         
-        # 计算相关度并排序
-        for result in results:
-            score = calculator.calculate_relevance(query, result)
-            result.relevance_score = score
-        
-        boosted_results = calculator.apply_math_domain_boost(results)
+        # 计算相关度并排序（同样用replace代替就地赋值）
+        scored_results = [
+            replace(result, relevance_score=calculator.calculate_relevance(query, result))
+            for result in results
+        ]
+
+        boosted_results = calculator.apply_math_domain_boost(scored_results)
         sorted_results = calculator.rank_results(boosted_results)
         
         # 显示前3个结果
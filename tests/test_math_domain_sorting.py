@@ -8,6 +8,9 @@ from datetime import datetime
 from math_search.relevance_calculation import RelevanceCalculator
 from math_search.models import SearchResult
 
+# 固定时间戳：避免每个夹具都调用datetime.now()，同时让测试可复现
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestMathDomainSorting:
     """数学领域排序优化测试类"""
@@ -25,7 +28,7 @@ class TestMathDomainSorting:
                 snippet="This paper presents novel research on manifold topology and homomorphism in functional analysis",
                 source="arXiv",
                 relevance_score=0.6,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TIMESTAMP,
                 math_content_detected=True
             ),
             
@@ -36,7 +39,7 @@ class TestMathDomainSorting:
                 snippet="Learn elementary algebra concepts with simple examples and tutorials",
                 source="Khan Academy",
                 relevance_score=0.7,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TIMESTAMP,
                 math_content_detected=True
             ),
             
@@ -47,7 +50,7 @@ class TestMathDomainSorting:
                 snippet="Graduate level course on linear algebra, eigenvalues, and matrix theory",
                 source="MIT",
                 relevance_score=0.65,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TIMESTAMP,
                 math_content_detected=True
             ),
             
@@ -58,7 +61,7 @@ class TestMathDomainSorting:
                 snippet="Research paper on differential equations and their applications in analysis",
                 source="Elsevier",
                 relevance_score=0.55,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TIMESTAMP,
                 math_content_detected=True
             ),
             
@@ -69,65 +72,74 @@ class TestMathDomainSorting:
                 snippet="Learn programming basics with simple coding examples",
                 source="Example",
                 relevance_score=0.8,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TIMESTAMP,
                 math_content_detected=False
             )
         ]
     
-    def test_math_domain_depth_boost_advanced_concepts(self):
-        """测试高级数学概念的深度权重提升"""
-        # 包含高级概念的文本
-        advanced_text = "manifold topology homomorphism functional analysis"
-        boost = self.calculator._get_math_domain_depth_boost(advanced_text)
-        
-        assert boost > 1.0
-        assert boost <= 1.8
-        
-        # 基础概念的文本
-        basic_text = "basic algebra introduction"
-        basic_boost = self.calculator._get_math_domain_depth_boost(basic_text)
-        
-        assert boost > basic_boost
-    
-    def test_math_domain_depth_boost_research_keywords(self):
-        """测试研究级关键词的深度权重提升"""
-        research_text = "theorem proof lemma research paper journal publication"
-        boost = self.calculator._get_math_domain_depth_boost(research_text)
-        
-        assert boost > 1.0
-        
-        # 非研究级文本
-        tutorial_text = "tutorial introduction basic examples"
-        tutorial_boost = self.calculator._get_math_domain_depth_boost(tutorial_text)
-        
-        assert boost > tutorial_boost
-    
-    def test_math_domain_depth_boost_math_symbols(self):
-        """测试数学符号检测的权重提升"""
-        symbol_text = "∫ f(x)dx = ∑ a_n where ∂f/∂x ≤ ∞"
-        boost = self.calculator._get_math_domain_depth_boost(symbol_text)
-        
-        assert boost > 1.0
-        
-        # 无符号文本
-        no_symbol_text = "regular text without math symbols"
-        no_symbol_boost = self.calculator._get_math_domain_depth_boost(no_symbol_text)
-        
-        assert boost > no_symbol_boost
-    
-    def test_math_domain_depth_boost_latex_detection(self):
-        """测试LaTeX检测的权重提升"""
-        latex_text = "The formula is $x^2 + y^2 = z^2$ and \\int_0^1 f(x) dx"
-        boost = self.calculator._get_math_domain_depth_boost(latex_text)
-        
-        assert boost > 1.0
-        
-        # 无LaTeX文本
-        no_latex_text = "regular text without latex"
-        no_latex_boost = self.calculator._get_math_domain_depth_boost(no_latex_text)
-        
-        assert boost > no_latex_boost
-    
+    @pytest.mark.parametrize(
+        "method_name, hi_text, lo_text, lo_expected, hi_cap",
+        [
+            # 深度权重：高级概念 / 研究关键词 / 数学符号 / LaTeX标记
+            ("_get_math_domain_depth_boost",
+             "manifold topology homomorphism functional analysis",
+             "basic algebra introduction", None, 1.8),
+            ("_get_math_domain_depth_boost",
+             "theorem proof lemma research paper journal publication",
+             "tutorial introduction basic examples", None, None),
+            ("_get_math_domain_depth_boost",
+             "∫ f(x)dx = ∑ a_n where ∂f/∂x ≤ ∞",
+             "regular text without math symbols", None, None),
+            ("_get_math_domain_depth_boost",
+             "The formula is $x^2 + y^2 = z^2$ and \\int_0^1 f(x) dx",
+             "regular text without latex", None, None),
+            # 术语权重：高级概念 > 基础概念 > 非数学文本(=1.0)
+            ("_get_math_terms_boost",
+             "manifold homomorphism topology",
+             "algebra calculus", None, None),
+            ("_get_math_terms_boost",
+             "algebra calculus",
+             "cooking recipe tutorial", 1.0, None),
+            # 术语密度：高密度 > 低密度 > 无数学术语(=1.0)
+            ("_calculate_math_term_density",
+             "algebra calculus geometry topology analysis theorem proof",
+             "this is a long text with only one algebra term in it", None, None),
+            ("_calculate_math_term_density",
+             "this is a long text with only one algebra term in it",
+             "this is regular text without any mathematical content", 1.0, None),
+            # 术语共现：3+个 > 2个 > 1个 > 无高级术语(=1.0)
+            ("_calculate_math_term_cooccurrence",
+             "manifold topology homomorphism functional analysis",
+             "category theory measure theory", None, None),
+            ("_calculate_math_term_cooccurrence",
+             "category theory measure theory",
+             "abstract algebra concepts", None, None),
+            ("_calculate_math_term_cooccurrence",
+             "abstract algebra concepts",
+             "basic algebra and simple calculus", 1.0, None),
+        ],
+        ids=[
+            "depth_advanced_concepts", "depth_research_keywords",
+            "depth_math_symbols", "depth_latex_detection",
+            "terms_advanced_vs_basic", "terms_basic_vs_non_math",
+            "density_high_vs_low", "density_low_vs_none",
+            "cooccurrence_multi_vs_dual", "cooccurrence_dual_vs_single",
+            "cooccurrence_single_vs_none",
+        ]
+    )
+    def test_boost_monotonicity(self, method_name, hi_text, lo_text, lo_expected, hi_cap):
+        """测试各项权重的单调性：数学性更强的文本得到更高的权重"""
+        method = getattr(self.calculator, method_name)
+        hi_boost = method(hi_text)
+        lo_boost = method(lo_text)
+
+        assert hi_boost > 1.0
+        assert hi_boost > lo_boost
+        if lo_expected is not None:
+            assert lo_boost == lo_expected
+        if hi_cap is not None:
+            assert hi_boost <= hi_cap
+
     def test_academic_level_boost_high_level(self):
         """测试高级学术指标的权重提升"""
         high_level_result = SearchResult(
@@ -136,7 +148,7 @@ class TestMathDomainSorting:
             snippet="Professor's research paper published in journal proceedings",
             source="University",
             relevance_score=0.5,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TIMESTAMP,
             math_content_detected=True
         )
         
@@ -151,7 +163,7 @@ class TestMathDomainSorting:
             snippet="Basic tutorial for elementary students",
             source="Example",
             relevance_score=0.5,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TIMESTAMP,
             math_content_detected=True
         )
         
@@ -166,7 +178,7 @@ class TestMathDomainSorting:
             snippet="University mathematics course content",
             source="University",
             relevance_score=0.5,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TIMESTAMP,
             math_content_detected=True
         )
         
@@ -193,23 +205,6 @@ class TestMathDomainSorting:
         # 验证权重层次
         assert arxiv_boost > mit_boost > wiki_boost > unknown_boost
     
-    def test_enhanced_math_terms_weights(self):
-        """测试增强的数学术语权重"""
-        # 测试高级概念
-        advanced_text = "manifold homomorphism topology"
-        advanced_boost = self.calculator._get_math_terms_boost(advanced_text)
-        
-        # 测试基础概念
-        basic_text = "algebra calculus"
-        basic_boost = self.calculator._get_math_terms_boost(basic_text)
-        
-        # 测试非数学文本
-        non_math_text = "cooking recipe tutorial"
-        non_math_boost = self.calculator._get_math_terms_boost(non_math_text)
-        
-        assert advanced_boost > basic_boost > non_math_boost
-        assert non_math_boost == 1.0
-    
     def test_multi_layer_sorting(self):
         """测试多层排序策略"""
         # 应用权重提升
@@ -299,7 +294,7 @@ class TestMathDomainSorting:
             snippet="PhD research on homomorphism, eigenvalues, fourier analysis, theorem proof",
             source="arXiv",
             relevance_score=0.95,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TIMESTAMP,
             math_content_detected=True
         )
         
@@ -332,44 +327,6 @@ class TestMathDomainSorting:
         assert len(sorted_results) == 1
         assert len(metrics) == 1
     
-    def test_math_term_density_calculation(self):
-        """测试数学术语密度计算"""
-        # 高密度数学术语文本
-        high_density_text = "algebra calculus geometry topology analysis theorem proof"
-        high_density_boost = self.calculator._calculate_math_term_density(high_density_text)
-        
-        # 低密度数学术语文本
-        low_density_text = "this is a long text with only one algebra term in it"
-        low_density_boost = self.calculator._calculate_math_term_density(low_density_text)
-        
-        # 无数学术语文本
-        no_math_text = "this is regular text without any mathematical content"
-        no_math_boost = self.calculator._calculate_math_term_density(no_math_text)
-        
-        assert high_density_boost > low_density_boost > no_math_boost
-        assert no_math_boost == 1.0
-    
-    def test_math_term_cooccurrence_calculation(self):
-        """测试数学术语共现计算"""
-        # 多个高级术语共现
-        multi_advanced_text = "manifold topology homomorphism functional analysis"
-        multi_boost = self.calculator._calculate_math_term_cooccurrence(multi_advanced_text)
-        
-        # 两个高级术语共现
-        dual_advanced_text = "category theory measure theory"
-        dual_boost = self.calculator._calculate_math_term_cooccurrence(dual_advanced_text)
-        
-        # 单个高级术语
-        single_advanced_text = "abstract algebra concepts"
-        single_boost = self.calculator._calculate_math_term_cooccurrence(single_advanced_text)
-        
-        # 无高级术语
-        no_advanced_text = "basic algebra and simple calculus"
-        no_boost = self.calculator._calculate_math_term_cooccurrence(no_advanced_text)
-        
-        assert multi_boost > dual_boost > single_boost > no_boost
-        assert no_boost == 1.0
-    
     def test_mathematical_complexity_score_calculation(self):
         """测试数学复杂度评分计算"""
         # 高复杂度文本
@@ -415,7 +372,7 @@ class TestMathDomainSorting:
             snippet="PhD research paper on category theory, homomorphism, manifold topology, functional analysis, theorem proof, and measure theory",
             source="arXiv",
             relevance_score=0.6,
-            timestamp=datetime.now(),
+            timestamp=FIXED_TIMESTAMP,
             math_content_detected=True
         )
         
@@ -463,7 +420,7 @@ class TestMathDomainSorting:
                 snippet="algebra calculus geometry analysis theorem",
                 source="Example",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FIXED_TIMESTAMP,
                 math_content_detected=True
             )
             similar_results.append(result)
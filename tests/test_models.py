@@ -3,289 +3,247 @@
 Data Models Unit Tests
 """
 
-import unittest
+import pytest
+from dataclasses import replace
 from datetime import datetime
 from math_search.models import SearchResult, SearchHistory, MathTerm
 
+# 固定时间戳：免去每次构造的datetime.now()调用，并使测试可复现
+FROZEN_TS = datetime(2024, 1, 1, 12, 0, 0)
 
-class TestSearchResult(unittest.TestCase):
+
+# ---------- SearchResult ----------
+
+@pytest.fixture(scope="module")
+def result_data():
+    """SearchResult的有效构造参数（测试只读不写）"""
+    return {
+        'title': '线性代数基础',
+        'url': 'https://example.com/linear-algebra',
+        'snippet': '线性代数是数学的一个分支...',
+        'source': 'Wikipedia',
+        'relevance_score': 0.85,
+        'timestamp': FROZEN_TS,
+        'math_content_detected': True
+    }
+
+
+@pytest.fixture(scope="module")
+def valid_result(result_data):
+    """规范的SearchResult实例：字段变体经dataclasses.replace派生"""
+    return SearchResult(**result_data)
+
+
+class TestSearchResult:
     """SearchResult 数据模型测试"""
-    
-    def setUp(self):
-        """测试前准备"""
-        self.valid_data = {
-            'title': '线性代数基础',
-            'url': 'https://example.com/linear-algebra',
-            'snippet': '线性代数是数学的一个分支...',
-            'source': 'Wikipedia',
-            'relevance_score': 0.85,
-            'timestamp': datetime.now(),
-            'math_content_detected': True
-        }
-    
-    def test_valid_search_result_creation(self):
+
+    def test_valid_search_result_creation(self, result_data):
         """测试有效的搜索结果创建"""
-        result = SearchResult(**self.valid_data)
-        self.assertEqual(result.title, self.valid_data['title'])
-        self.assertEqual(result.url, self.valid_data['url'])
-        self.assertEqual(result.relevance_score, self.valid_data['relevance_score'])
-        self.assertTrue(result.math_content_detected)
-    
-    def test_empty_title_validation(self):
-        """测试空标题验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['title'] = ''
-        with self.assertRaises(ValueError) as context:
-            SearchResult(**invalid_data)
-        self.assertIn('标题和URL不能为空', str(context.exception))
-    
-    def test_empty_url_validation(self):
-        """测试空URL验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['url'] = ''
-        with self.assertRaises(ValueError) as context:
-            SearchResult(**invalid_data)
-        self.assertIn('标题和URL不能为空', str(context.exception))
-    
-    def test_invalid_relevance_score_validation(self):
+        result = SearchResult(**result_data)
+        assert result.title == result_data['title']
+        assert result.url == result_data['url']
+        assert result.relevance_score == result_data['relevance_score']
+        assert result.math_content_detected
+
+    @pytest.mark.parametrize("field", ['title', 'url'])
+    def test_empty_required_field_validation(self, valid_result, field):
+        """测试空标题/空URL验证"""
+        with pytest.raises(ValueError, match='标题和URL不能为空'):
+            replace(valid_result, **{field: ''})
+
+    @pytest.mark.parametrize("bad_score", [-0.1, 1.1, 2.0, -1000.0])
+    def test_invalid_relevance_score_validation(self, valid_result, bad_score):
         """测试无效相关度评分验证"""
-        # 测试负数
-        invalid_data = self.valid_data.copy()
-        invalid_data['relevance_score'] = -0.1
-        with self.assertRaises(ValueError) as context:
-            SearchResult(**invalid_data)
-        self.assertIn('相关度评分必须在0-1之间', str(context.exception))
-        
-        # 测试大于1的数
-        invalid_data['relevance_score'] = 1.1
-        with self.assertRaises(ValueError) as context:
-            SearchResult(**invalid_data)
-        self.assertIn('相关度评分必须在0-1之间', str(context.exception))
-    
-    def test_to_dict_serialization(self):
+        with pytest.raises(ValueError, match='相关度评分必须在0-1之间'):
+            replace(valid_result, relevance_score=bad_score)
+
+    def test_to_dict_serialization(self, valid_result, result_data):
         """测试字典序列化"""
-        result = SearchResult(**self.valid_data)
-        result_dict = result.to_dict()
-        
-        self.assertEqual(result_dict['title'], self.valid_data['title'])
-        self.assertEqual(result_dict['url'], self.valid_data['url'])
-        self.assertEqual(result_dict['relevance_score'], self.valid_data['relevance_score'])
-        self.assertIsInstance(result_dict['timestamp'], str)  # 应该被转换为ISO格式字符串
-    
-    def test_from_dict_deserialization(self):
+        result_dict = valid_result.to_dict()
+
+        assert result_dict['title'] == result_data['title']
+        assert result_dict['url'] == result_data['url']
+        assert result_dict['relevance_score'] == result_data['relevance_score']
+        assert isinstance(result_dict['timestamp'], str)  # 应该被转换为ISO格式字符串
+
+    def test_from_dict_deserialization(self, valid_result):
         """测试字典反序列化"""
-        result = SearchResult(**self.valid_data)
-        result_dict = result.to_dict()
+        result_dict = valid_result.to_dict()
         reconstructed_result = SearchResult.from_dict(result_dict)
-        
-        self.assertEqual(reconstructed_result.title, result.title)
-        self.assertEqual(reconstructed_result.url, result.url)
-        self.assertEqual(reconstructed_result.relevance_score, result.relevance_score)
-        self.assertEqual(reconstructed_result.timestamp, result.timestamp)
 
+        assert reconstructed_result.title == valid_result.title
+        assert reconstructed_result.url == valid_result.url
+        assert reconstructed_result.relevance_score == valid_result.relevance_score
+        assert reconstructed_result.timestamp == valid_result.timestamp
+
+
+# ---------- SearchHistory ----------
+
+@pytest.fixture(scope="module")
+def history_data():
+    """SearchHistory的有效构造参数（测试只读不写）"""
+    return {
+        'id': 1,
+        'query_text': '线性代数矩阵运算',
+        'search_keywords': ['线性代数', '矩阵', '运算'],
+        'timestamp': FROZEN_TS,
+        'results_count': 15,
+        'top_result_url': 'https://example.com/top-result'
+    }
+
+
+@pytest.fixture(scope="module")
+def valid_history(history_data):
+    """规范的SearchHistory实例"""
+    return SearchHistory(**history_data)
 
-class TestSearchHistory(unittest.TestCase):
+
+class TestSearchHistory:
     """SearchHistory 数据模型测试"""
-    
-    def setUp(self):
-        """测试前准备"""
-        self.valid_data = {
-            'id': 1,
-            'query_text': '线性代数矩阵运算',
-            'search_keywords': ['线性代数', '矩阵', '运算'],
-            'timestamp': datetime.now(),
-            'results_count': 15,
-            'top_result_url': 'https://example.com/top-result'
-        }
-    
-    def test_valid_search_history_creation(self):
+
+    def test_valid_search_history_creation(self, history_data):
         """测试有效的搜索历史创建"""
-        history = SearchHistory(**self.valid_data)
-        self.assertEqual(history.id, self.valid_data['id'])
-        self.assertEqual(history.query_text, self.valid_data['query_text'])
-        self.assertEqual(history.search_keywords, self.valid_data['search_keywords'])
-        self.assertEqual(history.results_count, self.valid_data['results_count'])
-    
-    def test_empty_query_text_validation(self):
-        """测试空查询文本验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['query_text'] = ''
-        with self.assertRaises(ValueError) as context:
-            SearchHistory(**invalid_data)
-        self.assertIn('查询文本不能为空', str(context.exception))
-    
-    def test_negative_results_count_validation(self):
-        """测试负数结果数量验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['results_count'] = -1
-        with self.assertRaises(ValueError) as context:
-            SearchHistory(**invalid_data)
-        self.assertIn('结果数量不能为负数', str(context.exception))
-    
-    def test_empty_keywords_validation(self):
-        """测试空关键词验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['search_keywords'] = []
-        with self.assertRaises(ValueError) as context:
-            SearchHistory(**invalid_data)
-        self.assertIn('搜索关键词不能为空', str(context.exception))
-    
-    def test_negative_id_validation(self):
-        """测试负数ID验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['id'] = -1
-        with self.assertRaises(ValueError) as context:
-            SearchHistory(**invalid_data)
-        self.assertIn('ID不能为负数', str(context.exception))
-    
-    def test_to_dict_serialization(self):
+        history = SearchHistory(**history_data)
+        assert history.id == history_data['id']
+        assert history.query_text == history_data['query_text']
+        assert history.search_keywords == history_data['search_keywords']
+        assert history.results_count == history_data['results_count']
+
+    @pytest.mark.parametrize("field, bad_value, message", [
+        ('query_text', '', '查询文本不能为空'),
+        ('results_count', -1, '结果数量不能为负数'),
+        ('search_keywords', [], '搜索关键词不能为空'),
+        ('id', -1, 'ID不能为负数'),
+    ])
+    def test_field_validation(self, valid_history, field, bad_value, message):
+        """测试各字段的非法值验证"""
+        with pytest.raises(ValueError, match=message):
+            replace(valid_history, **{field: bad_value})
+
+    def test_to_dict_serialization(self, valid_history, history_data):
         """测试字典序列化"""
-        history = SearchHistory(**self.valid_data)
-        history_dict = history.to_dict()
-        
-        self.assertEqual(history_dict['id'], self.valid_data['id'])
-        self.assertEqual(history_dict['query_text'], self.valid_data['query_text'])
-        self.assertEqual(history_dict['search_keywords'], self.valid_data['search_keywords'])
-        self.assertIsInstance(history_dict['timestamp'], str)
-    
-    def test_from_dict_deserialization(self):
+        history_dict = valid_history.to_dict()
+
+        assert history_dict['id'] == history_data['id']
+        assert history_dict['query_text'] == history_data['query_text']
+        assert history_dict['search_keywords'] == history_data['search_keywords']
+        assert isinstance(history_dict['timestamp'], str)
+
+    def test_from_dict_deserialization(self, valid_history):
         """测试字典反序列化"""
-        history = SearchHistory(**self.valid_data)
-        history_dict = history.to_dict()
+        history_dict = valid_history.to_dict()
         reconstructed_history = SearchHistory.from_dict(history_dict)
-        
-        self.assertEqual(reconstructed_history.id, history.id)
-        self.assertEqual(reconstructed_history.query_text, history.query_text)
-        self.assertEqual(reconstructed_history.search_keywords, history.search_keywords)
-        self.assertEqual(reconstructed_history.timestamp, history.timestamp)
-    
-    def test_get_summary(self):
+
+        assert reconstructed_history.id == valid_history.id
+        assert reconstructed_history.query_text == valid_history.query_text
+        assert reconstructed_history.search_keywords == valid_history.search_keywords
+        assert reconstructed_history.timestamp == valid_history.timestamp
+
+    def test_get_summary(self, valid_history, history_data):
         """测试获取摘要功能"""
-        history = SearchHistory(**self.valid_data)
-        summary = history.get_summary()
-        
-        self.assertIn(self.valid_data['query_text'], summary)
-        self.assertIn('线性代数', summary)
-        self.assertIn(str(self.valid_data['results_count']), summary)
-    
-    def test_get_summary_with_long_text(self):
+        summary = valid_history.get_summary()
+
+        assert history_data['query_text'] in summary
+        assert '线性代数' in summary
+        assert str(history_data['results_count']) in summary
+
+    def test_get_summary_with_long_text(self, valid_history):
         """测试长文本摘要截断"""
-        long_data = self.valid_data.copy()
-        long_data['query_text'] = 'a' * 100  # 超过50字符的长文本
-        long_data['search_keywords'] = ['keyword1', 'keyword2', 'keyword3', 'keyword4', 'keyword5']  # 超过3个关键词
-        
-        history = SearchHistory(**long_data)
+        history = replace(
+            valid_history,
+            query_text='a' * 100,  # 超过50字符的长文本
+            search_keywords=['keyword1', 'keyword2', 'keyword3', 'keyword4', 'keyword5']  # 超过3个关键词
+        )
         summary = history.get_summary()
-        
-        self.assertIn('...', summary)  # 应该包含截断标记
 
+        assert '...' in summary  # 应该包含截断标记
+
+
+# ---------- MathTerm ----------
+
+@pytest.fixture(scope="module")
+def term_data():
+    """MathTerm的有效构造参数（测试只读不写）"""
+    return {
+        'term': '导数',
+        'latex_representation': r'\frac{d}{dx}',
+        'category': 'calculus',
+        'confidence': 0.9
+    }
+
+
+@pytest.fixture(scope="module")
+def valid_term(term_data):
+    """规范的MathTerm实例"""
+    return MathTerm(**term_data)
 
-class TestMathTerm(unittest.TestCase):
+
+class TestMathTerm:
     """MathTerm 数据模型测试"""
-    
-    def setUp(self):
-        """测试前准备"""
-        self.valid_data = {
-            'term': '导数',
-            'latex_representation': r'\frac{d}{dx}',
-            'category': 'calculus',
-            'confidence': 0.9
-        }
-    
-    def test_valid_math_term_creation(self):
+
+    def test_valid_math_term_creation(self, term_data):
         """测试有效的数学术语创建"""
-        term = MathTerm(**self.valid_data)
-        self.assertEqual(term.term, self.valid_data['term'])
-        self.assertEqual(term.latex_representation, self.valid_data['latex_representation'])
-        self.assertEqual(term.category, self.valid_data['category'])
-        self.assertEqual(term.confidence, self.valid_data['confidence'])
-    
-    def test_empty_term_validation(self):
+        term = MathTerm(**term_data)
+        assert term.term == term_data['term']
+        assert term.latex_representation == term_data['latex_representation']
+        assert term.category == term_data['category']
+        assert term.confidence == term_data['confidence']
+
+    def test_empty_term_validation(self, valid_term):
         """测试空术语验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['term'] = ''
-        with self.assertRaises(ValueError) as context:
-            MathTerm(**invalid_data)
-        self.assertIn('术语不能为空', str(context.exception))
-    
-    def test_invalid_confidence_validation(self):
+        with pytest.raises(ValueError, match='术语不能为空'):
+            replace(valid_term, term='')
+
+    @pytest.mark.parametrize("bad_confidence", [-0.1, 1.1, 2.0, -1000.0])
+    def test_invalid_confidence_validation(self, valid_term, bad_confidence):
         """测试无效置信度验证"""
-        # 测试负数
-        invalid_data = self.valid_data.copy()
-        invalid_data['confidence'] = -0.1
-        with self.assertRaises(ValueError) as context:
-            MathTerm(**invalid_data)
-        self.assertIn('置信度必须在0-1之间', str(context.exception))
-        
-        # 测试大于1的数
-        invalid_data['confidence'] = 1.1
-        with self.assertRaises(ValueError) as context:
-            MathTerm(**invalid_data)
-        self.assertIn('置信度必须在0-1之间', str(context.exception))
-    
-    def test_invalid_category_validation(self):
+        with pytest.raises(ValueError, match='置信度必须在0-1之间'):
+            replace(valid_term, confidence=bad_confidence)
+
+    def test_invalid_category_validation(self, valid_term):
         """测试无效类别验证"""
-        invalid_data = self.valid_data.copy()
-        invalid_data['category'] = 'invalid_category'
-        with self.assertRaises(ValueError) as context:
-            MathTerm(**invalid_data)
-        self.assertIn('无效的数学类别', str(context.exception))
-    
-    def test_valid_categories(self):
+        with pytest.raises(ValueError, match='无效的数学类别'):
+            replace(valid_term, category='invalid_category')
+
+    @pytest.mark.parametrize("category", [
+        'algebra', 'calculus', 'geometry', 'statistics',
+        'linear_algebra', 'differential_equations', 'topology',
+        'number_theory', 'discrete_math', 'analysis', 'other'
+    ])
+    def test_valid_categories(self, valid_term, category):
         """测试所有有效类别"""
-        valid_categories = [
-            'algebra', 'calculus', 'geometry', 'statistics', 
-            'linear_algebra', 'differential_equations', 'topology',
-            'number_theory', 'discrete_math', 'analysis', 'other'
-        ]
-        
-        for category in valid_categories:
-            data = self.valid_data.copy()
-            data['category'] = category
-            term = MathTerm(**data)  # 不应该抛出异常
-            self.assertEqual(term.category, category)
-    
-    def test_to_dict_serialization(self):
+        term = replace(valid_term, category=category)  # 不应该抛出异常
+        assert term.category == category
+
+    def test_to_dict_serialization(self, valid_term, term_data):
         """测试字典序列化"""
-        term = MathTerm(**self.valid_data)
-        term_dict = term.to_dict()
-        
-        self.assertEqual(term_dict['term'], self.valid_data['term'])
-        self.assertEqual(term_dict['latex_representation'], self.valid_data['latex_representation'])
-        self.assertEqual(term_dict['category'], self.valid_data['category'])
-        self.assertEqual(term_dict['confidence'], self.valid_data['confidence'])
-    
-    def test_from_dict_deserialization(self):
+        term_dict = valid_term.to_dict()
+
+        assert term_dict['term'] == term_data['term']
+        assert term_dict['latex_representation'] == term_data['latex_representation']
+        assert term_dict['category'] == term_data['category']
+        assert term_dict['confidence'] == term_data['confidence']
+
+    def test_from_dict_deserialization(self, valid_term):
         """测试字典反序列化"""
-        term = MathTerm(**self.valid_data)
-        term_dict = term.to_dict()
+        term_dict = valid_term.to_dict()
         reconstructed_term = MathTerm.from_dict(term_dict)
-        
-        self.assertEqual(reconstructed_term.term, term.term)
-        self.assertEqual(reconstructed_term.latex_representation, term.latex_representation)
-        self.assertEqual(reconstructed_term.category, term.category)
-        self.assertEqual(reconstructed_term.confidence, term.confidence)
-    
-    def test_is_high_confidence(self):
+
+        assert reconstructed_term.term == valid_term.term
+        assert reconstructed_term.latex_representation == valid_term.latex_representation
+        assert reconstructed_term.category == valid_term.category
+        assert reconstructed_term.confidence == valid_term.confidence
+
+    @pytest.mark.parametrize("confidence, expected", [
+        (0.85, True),   # 高置信度
+        (0.7, False),   # 低置信度
+        (0.8, True),    # 边界值
+    ])
+    def test_is_high_confidence(self, valid_term, confidence, expected):
         """测试高置信度判断"""
-        # 测试高置信度
-        high_confidence_data = self.valid_data.copy()
-        high_confidence_data['confidence'] = 0.85
-        high_term = MathTerm(**high_confidence_data)
-        self.assertTrue(high_term.is_high_confidence())
-        
-        # 测试低置信度
-        low_confidence_data = self.valid_data.copy()
-        low_confidence_data['confidence'] = 0.7
-        low_term = MathTerm(**low_confidence_data)
-        self.assertFalse(low_term.is_high_confidence())
-        
-        # 测试边界值
-        boundary_data = self.valid_data.copy()
-        boundary_data['confidence'] = 0.8
-        boundary_term = MathTerm(**boundary_data)
-        self.assertTrue(boundary_term.is_high_confidence())
+        term = replace(valid_term, confidence=confidence)
+        assert term.is_high_confidence() is expected
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
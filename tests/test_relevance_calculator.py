@@ -10,101 +10,109 @@ from unittest.mock import patch, MagicMock
 from math_search.relevance_calculation import RelevanceCalculator
 from math_search.models import SearchResult
 
+# 固定时间戳：免去每次构造的datetime.now()调用，并使测试可复现
+FROZEN_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="class")
+def calculator():
+    """类级共享的计算器实例：构造（词表、正则编译）只做一次"""
+    return RelevanceCalculator()
+
+
+@pytest.fixture(scope="class")
+def sample_results():
+    """类级共享的测试搜索结果（测试只读不写）"""
+    return [
+        SearchResult(
+            title="Linear Algebra Fundamentals",
+            url="https://mathworld.wolfram.com/LinearAlgebra.html",
+            snippet="Linear algebra is the branch of mathematics concerning linear equations and linear functions",
+            source="Wolfram MathWorld",
+            relevance_score=0.0,  # 将被计算器更新
+            timestamp=FROZEN_TS,
+            math_content_detected=True
+        ),
+        SearchResult(
+            title="Introduction to Calculus",
+            url="https://mit.edu/calculus/intro",
+            snippet="Calculus is the mathematical study of continuous change",
+            source="MIT OpenCourseWare",
+            relevance_score=0.0,
+            timestamp=FROZEN_TS,
+            math_content_detected=True
+        ),
+        SearchResult(
+            title="Basic Programming Tutorial",
+            url="https://example.com/programming",
+            snippet="Learn programming basics with simple examples",
+            source="Example Site",
+            relevance_score=0.0,
+            timestamp=FROZEN_TS,
+            math_content_detected=False
+        )
+    ]
+
 
 class TestRelevanceCalculator:
     """相关度计算器测试类"""
-    
-    def setup_method(self):
-        """测试前设置"""
-        self.calculator = RelevanceCalculator()
-        
-        # 创建测试用的搜索结果
-        self.sample_results = [
-            SearchResult(
-                title="Linear Algebra Fundamentals",
-                url="https://mathworld.wolfram.com/LinearAlgebra.html",
-                snippet="Linear algebra is the branch of mathematics concerning linear equations and linear functions",
-                source="Wolfram MathWorld",
-                relevance_score=0.0,  # 将被计算器更新
-                timestamp=datetime.now(),
-                math_content_detected=True
-            ),
-            SearchResult(
-                title="Introduction to Calculus",
-                url="https://mit.edu/calculus/intro",
-                snippet="Calculus is the mathematical study of continuous change",
-                source="MIT OpenCourseWare",
-                relevance_score=0.0,
-                timestamp=datetime.now(),
-                math_content_detected=True
-            ),
-            SearchResult(
-                title="Basic Programming Tutorial",
-                url="https://example.com/programming",
-                snippet="Learn programming basics with simple examples",
-                source="Example Site",
-                relevance_score=0.0,
-                timestamp=datetime.now(),
-                math_content_detected=False
-            )
-        ]
-    
-    def test_calculate_relevance_basic(self):
+
+    def test_calculate_relevance_basic(self, calculator, sample_results):
         """测试基础相关度计算"""
         query = "linear algebra"
-        result = self.sample_results[0]
-        
-        score = self.calculator.calculate_relevance(query, result)
-        
+        result = sample_results[0]
+
+        score = calculator.calculate_relevance(query, result)
+
         assert 0.0 <= score <= 1.0
         assert score > 0.5  # 应该有较高的相关度
-    
-    def test_calculate_relevance_math_content_boost(self):
+
+    def test_calculate_relevance_math_content_boost(self, calculator, sample_results):
         """测试数学内容检测加成"""
         query = "mathematics"
-        
+
         # 有数学内容的结果
-        math_result = self.sample_results[0]
-        math_score = self.calculator.calculate_relevance(query, math_result)
-        
+        math_result = sample_results[0]
+        math_score = calculator.calculate_relevance(query, math_result)
+
         # 无数学内容的结果
-        non_math_result = self.sample_results[2]
-        non_math_score = self.calculator.calculate_relevance(query, non_math_result)
-        
+        non_math_result = sample_results[2]
+        non_math_score = calculator.calculate_relevance(query, non_math_result)
+
         # 数学内容应该有更高的评分
         assert math_score > non_math_score
-    
-    def test_calculate_relevance_title_boost(self):
+
+    def test_calculate_relevance_title_boost(self, calculator, sample_results):
         """测试标题匹配加成"""
         query = "linear algebra"
-        result = self.sample_results[0]  # 标题包含"Linear Algebra"
-        
-        score = self.calculator.calculate_relevance(query, result)
-        
+        result = sample_results[0]  # 标题包含"Linear Algebra"
+
+        score = calculator.calculate_relevance(query, result)
+
         # 标题匹配应该提供加成
         assert score > 0.6
-    
-    def test_calculate_relevance_empty_query(self):
+
+    def test_calculate_relevance_empty_query(self, calculator, sample_results):
         """测试空查询"""
         query = ""
-        result = self.sample_results[0]
-        
-        score = self.calculator.calculate_relevance(query, result)
-        
+        result = sample_results[0]
+
+        score = calculator.calculate_relevance(query, result)
+
         assert score >= 0.0
         assert score <= 1.0
-    
-    def test_calculate_relevance_no_match(self):
+
+    def test_calculate_relevance_no_match(self, calculator, sample_results):
         """测试完全不匹配的查询"""
         query = "cooking recipes"
-        result = self.sample_results[0]  # 数学相关内容
-        
-        score = self.calculator.calculate_relevance(query, result)
-        
+        result = sample_results[0]  # 数学相关内容
+
+        score = calculator.calculate_relevance(query, result)
+
         assert 0.0 <= score <= 1.0
         assert score < 0.5  # 应该有较低的相关度
-    
-    def test_keyword_matching_math_terms(self):
+
+    def test_keyword_matching_math_terms(self, calculator):
         """测试数学术语关键词匹配"""
         query = "calculus derivative integral"
         result = SearchResult(
@@ -113,16 +121,16 @@ class TestRelevanceCalculator:
             snippet="Learn about derivatives and integrals in calculus",
             source="Math Site",
             relevance_score=0.0,
-            timestamp=datetime.now(),
+            timestamp=FROZEN_TS,
             math_content_detected=True
         )
-        
-        score = self.calculator.calculate_relevance(query, result)
-        
+
+        score = calculator.calculate_relevance(query, result)
+
         # 多个数学术语匹配应该有较高分
         assert score > 0.5
-    
-    def test_rank_results(self):
+
+    def test_rank_results(self, calculator):
         """测试结果排序"""
         # 设置不同的相关度评分
         results = [
@@ -132,7 +140,7 @@ class TestRelevanceCalculator:
                 snippet="Not very relevant content",
                 source="Example",
                 relevance_score=0.3,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=False
             ),
             SearchResult(
@@ -141,7 +149,7 @@ class TestRelevanceCalculator:
                 snippet="Very relevant content",
                 source="Example",
                 relevance_score=0.9,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=True
             ),
             SearchResult(
@@ -150,19 +158,19 @@ class TestRelevanceCalculator:
                 snippet="Somewhat relevant content",
                 source="Example",
                 relevance_score=0.6,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=False
             )
         ]
-        
-        ranked_results = self.calculator.rank_results(results)
-        
+
+        ranked_results = calculator.rank_results(results)
+
         # 检查排序是否正确（降序）
         assert ranked_results[0].relevance_score == 0.9
         assert ranked_results[1].relevance_score == 0.6
         assert ranked_results[2].relevance_score == 0.3
-    
-    def test_apply_math_domain_boost_academic_sources(self):
+
+    def test_apply_math_domain_boost_academic_sources(self, calculator):
         """测试学术来源权重提升"""
         results = [
             SearchResult(
@@ -171,7 +179,7 @@ class TestRelevanceCalculator:
                 snippet="Mathematical research paper",
                 source="arXiv",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=True
             ),
             SearchResult(
@@ -180,20 +188,20 @@ class TestRelevanceCalculator:
                 snippet="Regular article about math",
                 source="Example",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=True
             )
         ]
-        
-        boosted_results = self.calculator.apply_math_domain_boost(results)
-        
+
+        boosted_results = calculator.apply_math_domain_boost(results)
+
         # arXiv来源应该有更高的评分
         arxiv_result = next(r for r in boosted_results if 'arxiv.org' in r.url)
         regular_result = next(r for r in boosted_results if 'example.com' in r.url)
-        
+
         assert arxiv_result.relevance_score > regular_result.relevance_score
-    
-    def test_apply_math_domain_boost_math_content(self):
+
+    def test_apply_math_domain_boost_math_content(self, calculator):
         """测试数学内容检测权重提升"""
         results = [
             SearchResult(
@@ -202,7 +210,7 @@ class TestRelevanceCalculator:
                 snippet="Mathematical content with formulas",
                 source="Example",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=True
             ),
             SearchResult(
@@ -211,20 +219,20 @@ class TestRelevanceCalculator:
                 snippet="Regular content without math",
                 source="Example",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=False
             )
         ]
-        
-        boosted_results = self.calculator.apply_math_domain_boost(results)
-        
+
+        boosted_results = calculator.apply_math_domain_boost(results)
+
         # 数学内容应该有更高的评分
         math_result = next(r for r in boosted_results if r.math_content_detected)
         non_math_result = next(r for r in boosted_results if not r.math_content_detected)
-        
+
         assert math_result.relevance_score > non_math_result.relevance_score
-    
-    def test_apply_math_domain_boost_math_terms(self):
+
+    def test_apply_math_domain_boost_math_terms(self, calculator):
         """测试数学术语权重提升"""
         results = [
             SearchResult(
@@ -233,7 +241,7 @@ class TestRelevanceCalculator:
                 snippet="Learn algebra, calculus, and geometry theorems",
                 source="Example",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=True
             ),
             SearchResult(
@@ -242,121 +250,121 @@ class TestRelevanceCalculator:
                 snippet="General discussion about topics",
                 source="Example",
                 relevance_score=0.5,
-                timestamp=datetime.now(),
+                timestamp=FROZEN_TS,
                 math_content_detected=False
             )
         ]
-        
-        boosted_results = self.calculator.apply_math_domain_boost(results)
-        
+
+        boosted_results = calculator.apply_math_domain_boost(results)
+
         # 包含数学术语的结果应该有更高的评分
         math_terms_result = boosted_results[0]
         general_result = boosted_results[1]
-        
+
         assert math_terms_result.relevance_score > general_result.relevance_score
-    
-    def test_tokenize_text(self):
+
+    def test_tokenize_text(self, calculator):
         """测试文本分词"""
         text = "Hello, world! This is a test."
-        tokens = self.calculator._tokenize_text(text)
-        
+        tokens = calculator._tokenize_text(text)
+
         expected_tokens = ["Hello", "world", "This", "is", "a", "test"]
         assert tokens == expected_tokens
-    
-    def test_tokenize_text_with_math_symbols(self):
+
+    def test_tokenize_text_with_math_symbols(self, calculator):
         """测试包含数学符号的文本分词"""
         text = "f(x) = x^2 + 2x - 1"
-        tokens = self.calculator._tokenize_text(text)
-        
+        tokens = calculator._tokenize_text(text)
+
         # 应该正确处理数学符号
         assert "f" in tokens
         assert "x" in tokens
         assert "2x" in tokens
-    
-    def test_word_overlap_calculation(self):
+
+    def test_word_overlap_calculation(self, calculator):
         """测试词汇重叠计算"""
         text1 = "linear algebra mathematics"
         text2 = "algebra and linear equations"
-        
-        overlap = self.calculator._calculate_word_overlap(text1, text2)
-        
+
+        overlap = calculator._calculate_word_overlap(text1, text2)
+
         assert 0.0 <= overlap <= 1.0
         assert overlap > 0  # 应该有重叠
-    
-    def test_word_overlap_no_overlap(self):
+
+    def test_word_overlap_no_overlap(self, calculator):
         """测试无重叠的词汇"""
         text1 = "cooking recipes"
         text2 = "mathematics algebra"
-        
-        overlap = self.calculator._calculate_word_overlap(text1, text2)
-        
+
+        overlap = calculator._calculate_word_overlap(text1, text2)
+
         assert overlap == 0.0
-    
-    def test_word_overlap_empty_text(self):
+
+    def test_word_overlap_empty_text(self, calculator):
         """测试空文本的词汇重叠"""
         text1 = ""
         text2 = "mathematics algebra"
-        
-        overlap = self.calculator._calculate_word_overlap(text1, text2)
-        
+
+        overlap = calculator._calculate_word_overlap(text1, text2)
+
         assert overlap == 0.0
-    
-    def test_source_boost_recognition(self):
+
+    def test_source_boost_recognition(self, calculator):
         """测试来源权重识别"""
         # 测试已知学术来源
-        arxiv_boost = self.calculator._get_source_boost("https://arxiv.org/abs/1234.5678")
+        arxiv_boost = calculator._get_source_boost("https://arxiv.org/abs/1234.5678")
         assert arxiv_boost > 1.0
-        
-        mit_boost = self.calculator._get_source_boost("https://mit.edu/course/math")
+
+        mit_boost = calculator._get_source_boost("https://mit.edu/course/math")
         assert mit_boost > 1.0
-        
+
         # 测试未知来源
-        unknown_boost = self.calculator._get_source_boost("https://unknown-site.com/article")
+        unknown_boost = calculator._get_source_boost("https://unknown-site.com/article")
         assert unknown_boost == 1.0
-    
-    def test_math_terms_boost_recognition(self):
+
+    def test_math_terms_boost_recognition(self, calculator):
         """测试数学术语权重识别"""
         # 包含多个数学术语的文本
         math_text = "This algebra theorem involves calculus and geometry"
-        boost = self.calculator._get_math_terms_boost(math_text)
+        boost = calculator._get_math_terms_boost(math_text)
         assert boost > 1.0
-        
+
         # 不包含数学术语的文本
         regular_text = "This is a regular article about cooking"
-        boost = self.calculator._get_math_terms_boost(regular_text)
+        boost = calculator._get_math_terms_boost(regular_text)
         assert boost == 1.0
-    
-    def test_custom_tfidf_similarity(self):
+
+    def test_custom_tfidf_similarity(self, calculator):
         """测试自定义TF-IDF相似度计算"""
         text1 = "linear algebra mathematics"
         text2 = "algebra and linear equations in mathematics"
-        
-        similarity = self.calculator._custom_tfidf_similarity(text1, text2)
-        
+
+        similarity = calculator._custom_tfidf_similarity(text1, text2)
+
         assert 0.0 <= similarity <= 1.0
         assert similarity > 0  # 应该有相似度
-    
-    def test_cosine_similarity(self):
+
+    def test_cosine_similarity(self, calculator):
         """测试余弦相似度计算"""
         vec1 = {'word1': 0.5, 'word2': 0.3, 'word3': 0.0}
         vec2 = {'word1': 0.4, 'word2': 0.0, 'word3': 0.6}
         words = {'word1', 'word2', 'word3'}
-        
-        similarity = self.calculator._cosine_similarity(vec1, vec2, words)
-        
+
+        similarity = calculator._cosine_similarity(vec1, vec2, words)
+
         assert 0.0 <= similarity <= 1.0
-    
-    def test_relevance_score_bounds(self):
+
+    def test_relevance_score_bounds(self, calculator, sample_results):
         """测试相关度评分边界"""
         query = "test query"
-        result = self.sample_results[0]
-        
-        score = self.calculator.calculate_relevance(query, result)
-        
+        result = sample_results[0]
+
+        score = calculator.calculate_relevance(query, result)
+
         # 确保评分在有效范围内
         assert 0.0 <= score <= 1.0
-    
-    def test_boost_application_bounds(self):
+
+    def test_boost_application_bounds(self, calculator):
         """测试权重提升的边界"""
         # 创建一个高评分的结果
         high_score_result = SearchResult(
@@ -365,15 +373,32 @@ class TestRelevanceCalculator:
             snippet="algebra calculus geometry theorem",
             source="arXiv",
             relevance_score=0.9,
-            timestamp=datetime.now(),
+            timestamp=FROZEN_TS,
             math_content_detected=True
         )
-        
-        boosted_results = self.calculator.apply_math_domain_boost([high_score_result])
-        
+
+        boosted_results = calculator.apply_math_domain_boost([high_score_result])
+
         # 即使应用了权重提升，评分也不应超过1.0
         assert boosted_results[0].relevance_score <= 1.0
 
+    def test_calculate_relevance_batch(self, calculator, sample_results):
+        """测试批量相关度计算"""
+        query = "mathematics"
+        scores = calculator.calculate_relevance_batch(query, sample_results)
+
+        assert len(scores) == len(sample_results)
+        assert all(0.0 <= score <= 1.0 for score in scores)
+
+        # 数学内容的结果应该比非数学内容评分更高
+        assert scores[0] > scores[2]
+
+    def test_calculate_relevance_batch_empty(self, calculator):
+        """测试空结果列表的批量计算"""
+        scores = calculator.calculate_relevance_batch("algebra", [])
+
+        assert len(scores) == 0
+
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
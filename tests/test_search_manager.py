@@ -50,12 +50,11 @@ class TestSearchManager:
         manager = SearchManager(settings)
         assert manager.settings == settings
     
-    @patch('math_search.search_management.search_manager.requests.get')
-    def test_search_web_google_success(self, mock_get, search_manager):
+    @patch('requests.Session.get')
+    def test_search_web_google_success(self, mock_get, search_manager, make_mock_response):
         """测试Google搜索成功"""
         # 模拟Google API响应
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = make_mock_response({
             'items': [
                 {
                     'title': 'Test Math Article',
@@ -68,9 +67,7 @@ class TestSearchManager:
                     'snippet': 'Linear algebra and matrices'
                 }
             ]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        })
         
         results = search_manager.search_web(['calculus', 'derivative'])
         
@@ -86,16 +83,15 @@ class TestSearchManager:
         assert 'googleapis.com' in call_args[0][0]
         assert call_args[1]['params']['q'] == 'calculus derivative'
     
-    @patch('math_search.search_management.search_manager.requests.get')
-    def test_search_web_bing_fallback(self, mock_get, search_manager):
+    @patch('requests.Session.get')
+    def test_search_web_bing_fallback(self, mock_get, search_manager, make_mock_response):
         """测试Bing搜索作为备选"""
         # 设置Google搜索失败，Bing成功
         def side_effect(url, **kwargs):
             if 'googleapis.com' in url:
                 raise Exception("Google API error")
             else:
-                mock_response = Mock()
-                mock_response.json.return_value = {
+                return make_mock_response({
                     'webPages': {
                         'value': [
                             {
@@ -105,9 +101,7 @@ class TestSearchManager:
                             }
                         ]
                     }
-                }
-                mock_response.raise_for_status.return_value = None
-                return mock_response
+                })
         
         mock_get.side_effect = side_effect
         
@@ -118,12 +112,11 @@ class TestSearchManager:
         assert results[0].source == 'Bing'
         assert mock_get.call_count == 2  # Google失败后尝试Bing
     
-    @patch('math_search.search_management.search_manager.requests.get')
-    def test_search_academic_arxiv_success(self, mock_get, search_manager):
+    @patch('requests.Session.get')
+    def test_search_academic_arxiv_success(self, mock_get, search_manager, make_mock_response):
         """测试arXiv学术搜索成功"""
         # 模拟arXiv API响应
-        mock_response = Mock()
-        mock_response.text = '''<?xml version="1.0" encoding="UTF-8"?>
+        mock_get.return_value = make_mock_response(text='''<?xml version="1.0" encoding="UTF-8"?>
         <feed xmlns="http://www.w3.org/2005/Atom">
         <entry>
             <id>http://arxiv.org/abs/2301.00001v1</id>
@@ -135,9 +128,7 @@ class TestSearchManager:
             <title>Linear Algebra Applications</title>
             <summary>Applications of linear algebra in machine learning...</summary>
         </entry>
-        </feed>'''
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        </feed>''')
         
         results = search_manager.search_academic(['calculus', 'methods'])
         
@@ -236,7 +227,40 @@ class TestSearchManager:
         # 不包含数学内容
         assert search_manager._detect_math_content("这只是普通文本") == False
     
-    @patch('math_search.search_management.search_manager.requests.get')
+    @patch('requests.Session.get')
+    def test_search_all_concurrent(self, mock_get, search_manager, make_mock_response):
+        """测试网页与学术搜索并发合并"""
+        def side_effect(url, **kwargs):
+            if 'googleapis.com' in url:
+                return make_mock_response({
+                    'items': [
+                        {
+                            'title': 'Calculus Basics',
+                            'link': 'https://example.com/calculus',
+                            'snippet': 'Introduction to derivatives'
+                        }
+                    ]
+                })
+            return make_mock_response(text='''<?xml version="1.0" encoding="UTF-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <id>http://arxiv.org/abs/2301.00003v1</id>
+                <title>Calculus Research</title>
+                <summary>Research on calculus methods...</summary>
+            </entry>
+            </feed>''')
+
+        mock_get.side_effect = side_effect
+
+        combined = search_manager.search_all(['calculus'])
+
+        assert len(combined) == 2
+        sources = {r.source for r in combined}
+        assert sources == {'Google', 'arXiv'}
+        # 合并结果按相关度降序
+        assert combined[0].relevance_score >= combined[1].relevance_score
+
+    @patch('requests.Session.get')
     def test_search_web_api_error_handling(self, mock_get, search_manager):
         """测试API错误处理"""
         # 模拟网络错误
@@ -247,7 +271,7 @@ class TestSearchManager:
         # 应该返回空结果而不是抛出异常
         assert results == []
     
-    @patch('math_search.search_management.search_manager.requests.get')
+    @patch('requests.Session.get')
     def test_search_web_timeout_handling(self, mock_get, search_manager):
         """测试超时处理"""
         mock_get.side_effect = requests.exceptions.Timeout("Request timeout")
@@ -255,21 +279,18 @@ class TestSearchManager:
         results = search_manager.search_web(['test'])
         assert results == []
     
-    def test_max_results_limit(self, search_manager):
+    def test_max_results_limit(self, search_manager, make_mock_response):
         """测试结果数量限制"""
         # 设置较小的限制
         search_manager.settings.search_api.max_results_per_source = 2
-        
-        with patch('math_search.search_management.search_manager.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = make_mock_response({
                 'items': [
                     {'title': f'Result {i}', 'link': f'https://example.com/{i}', 'snippet': f'snippet {i}'}
                     for i in range(5)  # 返回5个结果
                 ]
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+            })
             
             results = search_manager.search_web(['test'])
             
@@ -292,14 +313,13 @@ class TestSearchManagerIntegration:
         )
         return settings
     
-    def test_full_search_workflow(self, integration_settings):
+    def test_full_search_workflow(self, integration_settings, make_mock_response):
         """测试完整搜索工作流"""
         manager = SearchManager(integration_settings)
-        
-        with patch('math_search.search_management.search_manager.requests.get') as mock_get:
+
+        with patch('requests.Session.get') as mock_get:
             # 模拟Google搜索响应
-            google_response = Mock()
-            google_response.json.return_value = {
+            google_response = make_mock_response({
                 'items': [
                     {
                         'title': 'Calculus Tutorial',
@@ -307,19 +327,17 @@ class TestSearchManagerIntegration:
                         'snippet': 'Learn derivatives and integrals'
                     }
                 ]
-            }
-            google_response.raise_for_status.return_value = None
-            
+            })
+
             # 模拟arXiv搜索响应
-            arxiv_response = Mock()
-            arxiv_response.text = '''
+            arxiv_response = make_mock_response(text='''<?xml version="1.0" encoding="UTF-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
             <entry>
                 <id>http://arxiv.org/abs/2301.00001v1</id>
                 <title>Advanced Calculus</title>
                 <summary>Research on calculus methods</summary>
             </entry>
-            '''
-            arxiv_response.raise_for_status.return_value = None
+            </feed>''')
             
             def mock_get_side_effect(url, **kwargs):
                 if 'googleapis.com' in url:
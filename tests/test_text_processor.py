@@ -324,6 +324,26 @@ class TestTextProcessor:
         assert len(keywords) > 0
         assert len(keywords) <= 10  # 关键词数量限制仍然有效
 
+    def test_identify_many(self):
+        """测试批量识别接口"""
+        texts = [
+            "The polynomial equation has multiple solutions.",
+            "这是一个关于导数和积分的笔记。"
+        ]
+
+        results = self.processor.identify_many(texts)
+
+        # 结果与输入一一对应，且与单文本路径一致
+        assert len(results) == 2
+        for text, terms in zip(texts, results):
+            expected = self.processor.identify_math_terms(text)
+            assert [t.term for t in terms] == [t.term for t in expected]
+
+        # 单个字符串输入也被接受
+        single = self.processor.identify_many(texts[0])
+        assert len(single) == 1
+        assert [t.term for t in single[0]] == [t.term for t in results[0]]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -5,6 +5,7 @@ import unittest
 import sys
 import os
 from datetime import datetime
+from operator import attrgetter
 
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,10 +17,11 @@ from math_search.models.search_history import SearchHistory
 
 class TestUIManager(unittest.TestCase):
     """UI管理器测试类"""
-    
-    def setUp(self):
-        """测试前准备"""
-        self.ui_manager = UIManager()
+
+    @classmethod
+    def setUpClass(cls):
+        """整个测试类共享一个UIManager（实例本身无状态，状态都在session_state里）"""
+        cls.ui_manager = UIManager()
     
     def test_ui_manager_initialization(self):
         """测试UI管理器初始化"""
@@ -132,8 +134,8 @@ class TestSearchResultIntegration(unittest.TestCase):
             )
         ]
         
-        # 按相关度排序
-        sorted_results = sorted(results, key=lambda x: x.relevance_score, reverse=True)
+        # 按相关度排序（attrgetter取键走C路径，免去每次比较的Python帧）
+        sorted_results = sorted(results, key=attrgetter('relevance_score'), reverse=True)
         
         self.assertEqual(sorted_results[0].relevance_score, 0.9)
         self.assertEqual(sorted_results[1].relevance_score, 0.8)
@@ -183,7 +185,7 @@ class TestSearchHistoryIntegration(unittest.TestCase):
         ]
         
         # 按时间排序（最新的在前）
-        sorted_history = sorted(history_list, key=lambda x: x.timestamp, reverse=True)
+        sorted_history = sorted(history_list, key=attrgetter('timestamp'), reverse=True)
         
         self.assertEqual(sorted_history[0].id, 2)  # 最新的记录
         self.assertEqual(sorted_history[1].id, 1)  # 较旧的记录
@@ -191,10 +193,11 @@ class TestSearchHistoryIntegration(unittest.TestCase):
 
 class TestMathContentDetection(unittest.TestCase):
     """数学内容检测专项测试"""
-    
-    def setUp(self):
-        """测试前准备"""
-        self.ui_manager = UIManager()
+
+    @classmethod
+    def setUpClass(cls):
+        """整个测试类共享一个UIManager"""
+        cls.ui_manager = UIManager()
     
     def test_latex_block_formulas(self):
         """测试LaTeX块级公式检测"""
@@ -251,10 +254,12 @@ class TestMathContentDetection(unittest.TestCase):
         # 应该检测到多个数学公式
         self.assertGreaterEqual(len(math_content), 3)
         
-        # 验证不同类型的公式都被检测到
-        has_inline = any('a^2 + b^2 = c^2' in formula for formula in math_content)
-        has_block = any('\\sum_{i=1}^n i' in formula for formula in math_content)
-        has_env = any('E = mc^2' in formula for formula in math_content)
+        # 验证不同类型的公式都被检测到（单趟遍历同时检查三类）
+        has_inline = has_block = has_env = False
+        for formula in math_content:
+            has_inline |= 'a^2 + b^2 = c^2' in formula
+            has_block |= '\\sum_{i=1}^n i' in formula
+            has_env |= 'E = mc^2' in formula
         
         self.assertTrue(has_inline, "应该检测到行内公式")
         self.assertTrue(has_block, "应该检测到块级公式")